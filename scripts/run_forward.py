@@ -5,6 +5,7 @@ import sys
 from pathlib import Path
 import shutil
 
+import numpy as np
 import pandas as pd
 
 # Ensure 'src' is on sys.path when invoked via subprocess
@@ -16,6 +17,7 @@ if str(SRC) not in sys.path:
 from macro.config import load_macro_yaml, write_config_echo
 from core.run_dir import create_run_directory
 from core.logging_utils import setup_run_logger, get_git_sha, log_run_start, log_run_end
+from core.io_utils import write_trace
 from macro.rates import build_month_index, ConstantRatesProvider, FiscalYearVariableRatesProvider, write_rates_preview
 from macro.issuance import FixedSharesPolicy, TransitionalSharesPolicy, write_issuance_preview
 from engine.state import DebtState
@@ -36,6 +38,7 @@ from diagnostics.qa import (
     write_hist_forward_breakdown_monthly,
     write_historical_shares,
     write_historical_effective_rates,
+    QA_TRACE_COLUMNS,
     _read_monthly_trace,
 )
 from diagnostics.uat import run_uat
@@ -223,18 +226,17 @@ def main() -> None:
 
     # Primary deficits: build from %GDP config (default to 0 if not provided)
     # Build GDP model first (also used later for annualization)
-    years_needed = sorted(set([d.year for d in idx] + [d.year + 1 for d in idx]))
+    # Calendar years in the horizon plus each following year (CY GDP blends FY(Y) and FY(Y+1))
+    horizon_years = np.unique(idx.year.to_numpy())
+    years_needed = np.union1d(horizon_years, horizon_years + 1).tolist()
     anchor_fy = pd.Timestamp(cfg.anchor_date).year if hasattr(cfg, "anchor_date") else idx[0].year
     if getattr(cfg, "gdp_annual_fy_growth_rate", None):
-        growth_fy = {int(y): float(v) / 100.0 for y, v in cfg.gdp_annual_fy_growth_rate.items()}
-        min_y, max_y = min(growth_fy), max(growth_fy)
-        growth_full = {}
-        last = growth_fy.get(min_y, 0.0)
-        for y in sorted(set([*years_needed, *growth_fy.keys()])):
-            if y in growth_fy:
-                last = growth_fy[y]
-            growth_full[y] = last if y >= anchor_fy else last
-        growth_fy = growth_full
+        provided = pd.Series(
+            {int(y): float(v) / 100.0 for y, v in cfg.gdp_annual_fy_growth_rate.items()},
+            dtype=float,
+        )
+        # Carry the last provided rate forward; years before the earliest provided use the earliest
+        growth_fy = provided.reindex(provided.index.union(years_needed)).ffill().bfill().to_dict()
     else:
         growth_fy = {y: 0.0 for y in years_needed if y >= anchor_fy}
     gdp_model = build_gdp_function(cfg.anchor_date, cfg.gdp_anchor_value_usd_millions, growth_fy)
@@ -267,7 +269,6 @@ def main() -> None:
             logger.debug("ADD REV PREVIEW MIRROR WARN: %s", str(_exc))
         # If anchor+index provided, also write inflation indexing diagnostics (per-year)
         try:
-            years_needed = sorted(set([d.year for d in idx] + [d.year + 1 for d in idx]))
             infl_prev = build_inflation_index_preview(cfg, years_needed, getattr(cfg, "additional_revenue_mode", ""))
             if infl_prev is not None:
                 infl_path = run_dir / "diagnostics" / "inflation_index_preview.csv"
@@ -282,7 +283,10 @@ def main() -> None:
                     logger.debug("INFL PREVIEW MIRROR WARN: %s", str(_exc2))
         except Exception as _exc:  # noqa: BLE001
             logger.debug("INFLATION INDEX PREVIEW WARN: %s", str(_exc))
-        deficits_used = (deficits_series.reindex(idx).fillna(0.0) - add_series.reindex(idx).fillna(0.0)).rename("primary_deficit")
+        # Subtract on aligned float arrays; one Series for the result
+        base_np = deficits_series.reindex(idx).to_numpy(dtype=np.float64, na_value=0.0)
+        add_np = add_series.reindex(idx).to_numpy(dtype=np.float64, na_value=0.0)
+        deficits_used = pd.Series(base_np - add_np, index=idx, name="primary_deficit")
     else:
         deficits_used = deficits_series
 
@@ -311,11 +315,7 @@ def main() -> None:
             df_enriched["additional_revenue"] = additional_series.reindex(df_enriched.index).values
             df_enriched["primary_deficit_adj"] = deficits_used.reindex(df_enriched.index).values
         trace_path.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            df_enriched.to_parquet(trace_path)
-        except Exception:
-            # Fallback to CSV if parquet engine not available
-            df_enriched.to_csv(trace_path.with_suffix(".csv"))
+        write_trace(df_enriched, trace_path)
     except Exception as _exc:  # noqa: BLE001
         logger.debug("TRACE ENRICH WARN: %s", str(_exc))
 
@@ -350,7 +350,9 @@ def main() -> None:
         logger.info("QA WRITE monthly_interest=%s effective_rate=%s bridge=%s", str(p1), str(p2), str(p3))
 
         # Write historical vs forward breakdown spreadsheets (FY and CY)
-        monthly = _read_monthly_trace(run_dir / "diagnostics" / "monthly_trace.parquet")
+        monthly = _read_monthly_trace(
+            run_dir / "diagnostics" / "monthly_trace.parquet", columns=QA_TRACE_COLUMNS
+        )
         # FY (annual)
         write_hist_forward_breakdown(
             monthly,
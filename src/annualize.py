@@ -5,7 +5,7 @@ from typing import Tuple
 
 import pandas as pd
 
-from core.dates import fiscal_year
+from core.dates import fiscal_year_series, month_start
 from macro.gdp import GDPModel
 
 
@@ -20,25 +20,26 @@ def annualize(monthly_df: pd.DataFrame, gdp_model: GDPModel) -> Tuple[pd.DataFra
     """
     if "interest_total" not in monthly_df.columns:
         raise ValueError("monthly_df must contain 'interest_total'")
-    # Normalize index name
-    if monthly_df.index.name != "date":
-        monthly_df = monthly_df.copy()
-        monthly_df.index.name = "date"
+    # Only the summed columns plus year keys; the (wide) monthly trace itself is not copied
+    months = month_start(monthly_df.index).rename("date")
+    value_cols = [c for c in ("interest_total", "additional_revenue") if c in monthly_df.columns]
+    df = pd.DataFrame(
+        {
+            **{c: monthly_df[c].to_numpy() for c in value_cols},
+            "CY": months.year,
+            "FY": fiscal_year_series(months).to_numpy(),
+        },
+        index=months,
+    )
 
-    df = monthly_df.copy()
-    df.index = pd.to_datetime(pd.DatetimeIndex(df.index)).to_period("M").to_timestamp()
-    df["CY"] = df.index.year
-    df["FY"] = df.index.map(fiscal_year)
+    # One grouped sum per frame over all value columns (compensated summation, as before);
+    # additional_revenue, if present, rides along instead of a second groupby + merge
+    def _sum_by(key: str) -> pd.DataFrame:
+        table = df.groupby(key, as_index=False)[value_cols].sum()
+        return table.rename(columns={key: "year", "interest_total": "interest"})
 
-    cy = df.groupby("CY", as_index=False)["interest_total"].sum().rename(columns={"CY": "year", "interest_total": "interest"})
-    fy = df.groupby("FY", as_index=False)["interest_total"].sum().rename(columns={"FY": "year", "interest_total": "interest"})
-
-    # Optionally aggregate additional revenue if present
-    if "additional_revenue" in df.columns:
-        cy_add = df.groupby("CY", as_index=False)["additional_revenue"].sum().rename(columns={"CY": "year"})
-        fy_add = df.groupby("FY", as_index=False)["additional_revenue"].sum().rename(columns={"FY": "year"})
-        cy = cy.merge(cy_add, on="year", how="left")
-        fy = fy.merge(fy_add, on="year", how="left")
+    cy = _sum_by("CY")
+    fy = _sum_by("FY")
 
     def _with_gdp(table: pd.DataFrame, frame: str) -> pd.DataFrame:
         out = table.copy()
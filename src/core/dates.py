@@ -54,6 +54,18 @@ def fiscal_year_series(values: Union[pd.Series, pd.DatetimeIndex, Iterable[DateL
         return pd.Series(fy.astype("int64").to_numpy(), index=idx, name="fy")
 
 
+def month_start(values: Union[pd.Series, pd.DatetimeIndex, Iterable[DateLike]]) -> pd.DatetimeIndex:
+    """Floor datelike values to the first day of their month.
+
+    Same result as ``.to_period("M").to_timestamp()`` via a datetime64 unit cast,
+    without building Period objects.
+    """
+    ts = pd.DatetimeIndex(pd.to_datetime(values))
+    if ts.tz is not None:
+        ts = ts.tz_localize(None)
+    return pd.DatetimeIndex(ts.to_numpy().astype("datetime64[M]").astype("datetime64[ns]"))
+
+
 def write_sample_fy_check(out_path: Union[str, Path] = "output/diagnostics/sample_fy_check.csv") -> Path:
     """Write a 10-row CSV demonstrating fiscal year mapping across the boundary.
 
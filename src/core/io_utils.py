@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+try:  # optional: parquet traces via PyArrow
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - CSV traces
+    pa = None
+    feather = None
+    pq = None
+
+
+# Detected once at import; writers and readers pick parquet or CSV from this,
+# not per-call try/except
+HAS_PARQUET = pq is not None
+
+
+def trace_read_path(path: str | Path) -> Path:
+    """Resolve which monthly trace file to read.
+
+    For a ``.parquet`` path: its Feather sidecar when present and not older than the parquet,
+    then the parquet itself when usable, else its CSV sibling.
+    """
+    p = Path(path)
+    if p.suffix.lower() == ".parquet":
+        if HAS_PARQUET:
+            fea = p.with_suffix(".feather")
+            if fea.exists() and (not p.exists() or fea.stat().st_mtime_ns >= p.stat().st_mtime_ns):
+                return fea
+            if p.exists():
+                return p
+        p = p.with_suffix(".csv")
+    if p.exists():
+        return p
+    if p.with_suffix(".csv").exists():
+        return p.with_suffix(".csv")
+    raise FileNotFoundError(f"Monthly trace not found: {path}")
+
+
+def write_trace(df: pd.DataFrame, out: str | Path) -> Path:
+    """Write a monthly trace and return the path written.
+
+    Parquet (snappy, plain float pages) when PyArrow is available, plus an uncompressed
+    Feather copy next to it for fast diagnostics reloads; otherwise CSV next to the requested
+    path. The parquet stays the archived trace.
+    """
+    out = Path(out)
+    if not HAS_PARQUET:
+        csv = out.with_suffix(".csv")
+        df.to_csv(csv)
+        return csv
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    pq.write_table(
+        table,
+        out,
+        compression="snappy",
+        use_dictionary=False,
+        data_page_size=1 << 20,
+    )
+    feather.write_feather(table, out.with_suffix(".feather"), compression="uncompressed")
+    return out
+
+
+def read_feather_trace(
+    p: str | Path, wanted: set[str] | None = None
+) -> tuple[pd.DataFrame, list[str]]:
+    """Read a Feather trace and the names of all its fields.
+
+    The returned frame is projected to ``wanted`` fields when given.
+    """
+    names = pa.ipc.open_file(pa.memory_map(str(p))).schema.names  # footer only
+    cols = None if wanted is None else [c for c in names if c in wanted]
+    table = feather.read_table(p, columns=cols, memory_map=True)
+    return table.to_pandas(), names
+
+
+def write_preview(df: pd.DataFrame, out_path: str | Path, fmt: str = "csv") -> Path:
+    """Write a diagnostics preview table and return the path written.
+
+    ``fmt="csv"`` (default) writes chunked CSV with a fixed date format; ``fmt="parquet"`` writes
+    zstd parquet next to ``out_path`` and falls back to CSV when PyArrow is missing.
+    """
+    p = Path(out_path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    kind = str(fmt).lower()
+    if kind not in {"csv", "parquet"}:
+        raise ValueError(f"Unsupported preview format: {fmt!r} (expected 'csv' or 'parquet')")
+    if kind == "parquet" and HAS_PARQUET:
+        p = p.with_suffix(".parquet")
+        df.to_parquet(p, index=False, compression="zstd")
+        return p
+    if kind == "parquet":
+        p = p.with_suffix(".csv")
+    df.to_csv(p, index=False, chunksize=10_000, date_format="%Y-%m-%d")
+    return p
@@ -1,33 +1,141 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Callable, Dict, Sequence, Tuple
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import json
+import matplotlib
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.ticker import PercentFormatter
 
-from core.dates import fiscal_year
+from core.dates import fiscal_year, fiscal_year_series, month_start
+from core.io_utils import pq, read_feather_trace, trace_read_path
+from core.types import BUCKETS_ALL, BUCKETS_ISSUANCE
 from macro.config import load_macro_yaml
-from macro.gdp import GDPModel
+from macro.gdp import GDPModel, build_gdp_function
 
 
-def _read_monthly_trace(path: str | Path) -> pd.DataFrame:
+def _file_key(path: str | Path) -> Tuple[str, int]:
+    """Cache key for an input file: path plus mtime so edits invalidate cached entries."""
     p = Path(path)
-    if p.suffix.lower() == ".parquet" and p.exists():
-        try:
-            df = pd.read_parquet(p)
-        except Exception:
-            df = pd.read_csv(p.with_suffix(".csv"))
+    return str(p), (p.stat().st_mtime_ns if p.exists() else -1)
+
+
+def _gdp_model(macro_path: str | Path, min_year: int, max_year: int) -> GDPModel:
+    """GDP model covering [min_year, max_year+1] using FY growth from config when available."""
+    cfg = load_macro_yaml(macro_path)
+    if getattr(cfg, "gdp_annual_fy_growth_rate", None):
+        # Config growth is percent; convert to decimals and fill coverage for [min_year, max_year+1]
+        provided = pd.Series(
+            {int(y): float(v) / 100.0 for y, v in cfg.gdp_annual_fy_growth_rate.items()},
+            dtype=float,
+        ).sort_index()
+        years_needed = pd.RangeIndex(min_year, max_year + 2)
+        # Carry the last provided rate forward; years before the earliest provided use the earliest.
+        # Fill over the union so a provided year preceding the window still seeds it.
+        growth = (
+            provided.reindex(provided.index.union(years_needed))
+            .ffill()
+            .bfill()
+            .reindex(years_needed)
+        )
+        growth_fy = growth.to_dict()
     else:
-        # default to CSV
-        if p.exists():
-            df = pd.read_csv(p)
-        elif p.with_suffix(".csv").exists():
-            df = pd.read_csv(p.with_suffix(".csv"))
-        else:
-            raise FileNotFoundError(f"Monthly trace not found: {p}")
+        # Flat growth across coverage
+        growth_fy = {int(y): 0.0 for y in range(min_year, max_year + 2)}
+    return build_gdp_function(cfg.anchor_date, cfg.gdp_anchor_value_usd_millions, growth_fy)
+
+
+# Fixed category set so groupby/pivot work on small integer codes instead of hashing strings
+DEBT_CATEGORY_DTYPE = pd.CategoricalDtype(list(BUCKETS_ALL))
+
+
+INTEREST_BUCKET_COLS = ["interest_short", "interest_nb", "interest_tips"]
+STOCK_BUCKET_COLS = ["stock_short", "stock_nb", "stock_tips"]
+
+
+def _total_interest(monthly_df: pd.DataFrame) -> np.ndarray:
+    """Marketable interest plus other_interest (when present) as a float64 array."""
+    total = monthly_df["interest_total"].to_numpy(dtype=np.float64)
+    if "other_interest" in monthly_df.columns:
+        total = total + monthly_df["other_interest"].to_numpy(dtype=np.float64)
+    return total
+
+
+def _bucket_frames(monthly_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Project forward bucket interest and stocks on a month-start index.
+
+    Only the six bucket columns are materialized; the rest of the trace is never copied.
+    """
+    idx = month_start(monthly_df.index)
+    interest = (
+        monthly_df[INTEREST_BUCKET_COLS].astype(np.float64, copy=False).set_axis(idx, copy=False)
+    )
+    stocks = monthly_df[STOCK_BUCKET_COLS].astype(np.float64, copy=False).set_axis(idx, copy=False)
+    return interest, stocks
+
+
+@functools.lru_cache(maxsize=8)
+def _hist_monthly_cached(key: Tuple[str, int]) -> pd.DataFrame:
+    hm = pd.read_csv(key[0])
+    # Expect 'Record Date' monthly and 'Interest Expense'
+    if "Record Date" not in hm.columns or "Interest Expense" not in hm.columns:
+        raise ValueError("historical monthly file missing expected columns")
+    hm["Record Date"] = pd.to_datetime(hm["Record Date"]).dt.to_period("M").dt.to_timestamp()
+    hm = hm.sort_values("Record Date", kind="stable")
+    if "Debt Category" in hm.columns:
+        hm["Debt Category"] = hm["Debt Category"].astype(DEBT_CATEGORY_DTYPE)
+    return hm
+
+
+def _read_hist_monthly(path: str | Path) -> pd.DataFrame:
+    """Read historical interest by category with month-start dates and categorical buckets.
+
+    The parse is cached by path and mtime; each caller gets its own copy of the frame.
+    """
+    return _hist_monthly_cached(_file_key(path)).copy()
+
+
+def _split_at_anchor(months: pd.Index, anchor: pd.Timestamp) -> Tuple[pd.Index, pd.Index]:
+    """Split month starts into historical (before the anchor month) and forward (at/after)."""
+    is_hist = months < anchor
+    return months[is_hist], months[~is_hist]
+
+
+# Monthly trace fields referenced by the plots, bridge table and breakdown writers
+QA_TRACE_COLUMNS = ("interest_total", "other_interest", *INTEREST_BUCKET_COLS, *STOCK_BUCKET_COLS)
+
+
+def _read_parquet(p: Path, wanted: set[str] | None) -> pd.DataFrame:
+    cols = None
+    if wanted is not None:
+        # Project to columns present in the file (e.g. other_interest is optional)
+        cols = [c for c in pq.read_schema(p).names if c in wanted]
+    table = pq.read_table(
+        p, columns=cols, pre_buffer=True, use_threads=True, use_pandas_metadata=True
+    )
+    return table.to_pandas()
+
+
+def _read_monthly_trace(path: str | Path, columns: Sequence[str] | None = None) -> pd.DataFrame:
+    """Read the monthly trace; ``columns`` limits the read to those fields (plus the date)."""
+    wanted = None if columns is None else {"date", *columns}
+    usecols = None if wanted is None else wanted.__contains__
+    src = trace_read_path(path)
+    if src.suffix.lower() == ".feather":
+        df, _ = read_feather_trace(src, wanted)
+    elif src.suffix.lower() == ".parquet":
+        df = _read_parquet(src, wanted)
+    else:
+        df = pd.read_csv(src, usecols=usecols)
     if "date" in df.columns:
         df["date"] = pd.to_datetime(df["date"]).dt.to_period("M").dt.to_timestamp()
         df = df.set_index("date")
@@ -37,9 +145,23 @@ def _read_monthly_trace(path: str | Path) -> pd.DataFrame:
     return df
 
 
+# Raster settings applied while QA charts render (simplified, chunked Agg paths)
+QA_RC_PARAMS = {"path.simplify": True, "agg.path.chunksize": 10000}
+# Default cap on concurrent chart renders (each holds a full Agg raster while saving)
+QA_MAX_WORKERS = 4
+
+
+def _new_axes() -> Tuple[Figure, Axes]:
+    # Standalone Figure (not registered with pyplot) so plots can render concurrently;
+    # bound to an Agg canvas directly, independent of the process-wide backend
+    fig = Figure(figsize=(9, 4))
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
 def _plot_monthly_interest(df: pd.DataFrame, out_dir: Path) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
-    fig, ax = plt.subplots(figsize=(9, 4))
+    fig, ax = _new_axes()
     ax.plot(df.index, df["interest_total"], label="Interest (marketable)")
     if "other_interest" in df.columns:
         ax.plot(df.index, df["interest_total"] + df["other_interest"], label="Interest (total)")
@@ -50,7 +172,6 @@ def _plot_monthly_interest(df: pd.DataFrame, out_dir: Path) -> Path:
     p = out_dir / "monthly_interest.png"
     fig.tight_layout()
     fig.savefig(p)
-    plt.close(fig)
     return p
 
 
@@ -58,20 +179,25 @@ def _plot_effective_rate(df: pd.DataFrame, out_dir: Path) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
     # Compute monthly effective rate then aggregate to fiscal-year average (weighted by monthly stock)
     total_stock = df[["stock_short", "stock_nb", "stock_tips"]].sum(axis=1)
-    monthly_rate = (df["interest_total"].astype(float) / total_stock.replace(0.0, pd.NA)).astype(float)
+    # NaN (not pd.NA) for zero stock keeps the ratio float64 without a cast
+    monthly_rate = df["interest_total"] / total_stock.replace(0.0, np.nan)
     # Weighted FY average: sum(interest) / avg(stock) per FY equals sum(monthly_rate * stock) / sum(stock)
-    df_tmp = pd.DataFrame({
-        "rate": monthly_rate,
-        "stock": total_stock.astype(float),
-    }, index=pd.to_datetime(pd.DatetimeIndex(df.index)).to_period("M").to_timestamp())
-    df_tmp["FY"] = df_tmp.index.map(fiscal_year)
-    grouped = df_tmp.groupby("FY", as_index=True)
-    # Avoid division by zero
-    numer = (grouped.apply(lambda g: float((g["rate"] * g["stock"]).sum())))
-    denom = (grouped.apply(lambda g: float(g["stock"].sum())))
-    eff_fy = (numer / denom).astype(float) * 12.0
-    fig, ax = plt.subplots(figsize=(9, 4))
-    ax.plot(eff_fy.index.astype(int), eff_fy.values, label="Effective rate (FY annualized)")
+    fy_years, fy_pos = np.unique(
+        fiscal_year_series(pd.DatetimeIndex(df.index)).to_numpy(), return_inverse=True
+    )
+    weighted = (monthly_rate * total_stock).to_numpy(dtype=np.float64)
+    stock = total_stock.to_numpy(dtype=np.float64)
+    # Per-FY accumulators; NaN terms (zero-stock months) are skipped as Series.sum would
+    numer = np.bincount(
+        fy_pos, weights=np.where(np.isnan(weighted), 0.0, weighted), minlength=len(fy_years)
+    )
+    denom = np.bincount(
+        fy_pos, weights=np.where(np.isnan(stock), 0.0, stock), minlength=len(fy_years)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eff_fy = (numer / denom) * 12.0
+    fig, ax = _new_axes()
+    ax.plot(fy_years, eff_fy, label="Effective rate (FY annualized)")
     ax.set_title("Effective Interest Rate (FY annualized)")
     ax.set_xlabel("Fiscal Year")
     # Format as percentage with 1 decimal and remove y-axis title
@@ -80,22 +206,25 @@ def _plot_effective_rate(df: pd.DataFrame, out_dir: Path) -> Path:
     p = out_dir / "effective_rate.png"
     fig.tight_layout()
     fig.savefig(p)
-    plt.close(fig)
     return p
 
 
 def _plot_annual(annual_path: str | Path, out_dir: Path, title: str) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
-    df = pd.read_csv(annual_path)
-    fig, ax = plt.subplots(figsize=(9, 4))
+    # Only the plotted columns, as plain float64 arrays
+    df = pd.read_csv(annual_path, usecols=["year", "interest", "pct_gdp"])
+    years = df["year"].to_numpy()
+    pct_gdp = df["pct_gdp"].to_numpy(dtype=np.float64)
+    # USD millions in CSV -> USD trillions
+    interest_trn = df["interest"].to_numpy(dtype=np.float64) / 1_000_000.0
+    fig, ax = _new_axes()
     # Left axis: % of GDP with 1-decimal percent formatter
-    ax.plot(df["year"], df["pct_gdp"], color="tab:red", marker="s", label="% of GDP")
+    ax.plot(years, pct_gdp, color="tab:red", marker="s", label="% of GDP")
     ax.yaxis.set_major_formatter(PercentFormatter(xmax=1, decimals=1))
     ax.set_ylabel("% of GDP")
-    # Right axis: USD trillions (interest is in USD millions in CSV)
+    # Right axis: USD trillions
     ax2 = ax.twinx()
-    interest_trn = (df["interest"].astype(float) / 1_000_000.0)
-    ax2.plot(df["year"], interest_trn, marker="o", label="Interest")
+    ax2.plot(years, interest_trn, marker="o", label="Interest")
     ax2.set_ylabel("USD trillions")
     ax.set_title(title)
     ax.set_xlabel("Year")
@@ -109,7 +238,6 @@ def _plot_annual(annual_path: str | Path, out_dir: Path, title: str) -> Path:
         "left_ticklabels": [t.get_text() for t in ax.get_yticklabels()],
     }
     p.with_suffix(".meta.json").write_text(json.dumps(meta, indent=2))
-    plt.close(fig)
     return p
 
 
@@ -133,25 +261,21 @@ def _compose_hist_vs_forward_series(
     if frame not in {"FY", "CY"}:
         raise ValueError("frame must be 'FY' or 'CY'")
 
-    df = monthly_df.copy()
-    df.index = pd.to_datetime(pd.DatetimeIndex(df.index)).to_period("M").to_timestamp()
+    idx = month_start(monthly_df.index)
     # Include other_interest if present to match historical coverage
-    total_col = "interest_total"
-    if "other_interest" in df.columns:
-        df["_total_interest"] = df["interest_total"].astype(float) + df["other_interest"].astype(float)
-        total_col = "_total_interest"
+    total = _total_interest(monthly_df)
 
     if frame == "FY":
-        df["Y"] = df.index.map(fiscal_year)
+        year_keys = fiscal_year_series(idx).to_numpy()
         year_col = "Fiscal Year"
     else:
-        df["Y"] = df.index.year
+        year_keys = idx.year.to_numpy()
         year_col = "Calendar Year"
 
     # Determine anchor month start
     anchor = pd.Timestamp(anchor_date).to_period("M").to_timestamp()
-    # Forward totals per year based on full-year monthly coverage from df
-    totals_by_year = df.groupby("Y", as_index=True)[total_col].sum()
+    # Forward totals per year based on full-year monthly coverage from the trace
+    totals_by_year = pd.Series(total).groupby(year_keys).sum()
 
     # Historical totals (full-year for years < anchor; YTD for anchor year)
     if year_col not in hist_df.columns or "Interest Expense" not in hist_df.columns:
@@ -161,38 +285,41 @@ def _compose_hist_vs_forward_series(
         .dropna()
         .rename(columns={year_col: "Y", "Interest Expense": "hist"})
         .set_index("Y")["hist"]
-        .astype(float)
+        .astype(np.float64, copy=False)
     )
 
     anchor_year = int(anchor.year if frame == "CY" else fiscal_year(anchor))
 
     # Build aligned year index covering historical table and monthly data
-    years = sorted(set(hist_tbl.index.tolist()) | set(df["Y"].unique().tolist()))
+    years_idx = hist_tbl.index.union(pd.Index(np.unique(year_keys))).rename(None)
     # Historical part (T4b): years < anchor_year use full historical; anchor_year excluded
-    hist_series = pd.Series(index=years, dtype=float)
-    for y in years:
-        if y < anchor_year:
-            hist_series.loc[y] = float(hist_tbl.get(y, float("nan")))
-        elif y == anchor_year:
-            # Exclude current year from historical (plot as forward)
-            hist_series.loc[y] = float("nan")
-        else:
-            hist_series.loc[y] = float("nan")
+    hist_series = hist_tbl.reindex(years_idx).where(years_idx < anchor_year).rename(None)
 
     # Forward part (T4b): anchor year = monthly full-year + historical YTD; years after = monthly full-year
-    fwd_series = pd.Series(index=years, dtype=float)
-    for y in years:
-        if y < anchor_year:
-            fwd_series.loc[y] = float("nan")
-        elif y == anchor_year:
-            monthly_full = float(totals_by_year.get(y, 0.0))
-            fwd_series.loc[y] = monthly_full + float(hist_tbl.get(y, 0.0))
-        else:
-            fwd_series.loc[y] = float(totals_by_year.get(y, float("nan")))
+    fwd_series = totals_by_year.reindex(years_idx).where(years_idx >= anchor_year)
+    if anchor_year in years_idx:
+        monthly_full = float(totals_by_year.get(anchor_year, 0.0))
+        fwd_series.loc[anchor_year] = monthly_full + float(hist_tbl.get(anchor_year, 0.0))
 
     return hist_series, fwd_series, anchor_year
 
 
+@functools.lru_cache(maxsize=4)
+def _read_hist_totals(key: Tuple[str, int]) -> pd.DataFrame:
+    # Shared across the raw and %GDP overlays; callers treat the frame as read-only
+    return pd.read_csv(key[0])
+
+
+def _hist_vs_forward(
+    monthly_df: pd.DataFrame, hist_path: str | Path, *, macro_path: str | Path, frame: str
+) -> Tuple[pd.Series, pd.Series, int]:
+    cfg = load_macro_yaml(macro_path)
+    hist = _read_hist_totals(_file_key(hist_path))
+    return _compose_hist_vs_forward_series(
+        monthly_df, hist, anchor_date=cfg.anchor_date, frame=frame
+    )
+
+
 def _plot_historical_vs_forward(
     monthly_df: pd.DataFrame,
     hist_fy_path: str | Path,
@@ -200,20 +327,20 @@ def _plot_historical_vs_forward(
     macro_path: str | Path,
     out_dir: Path,
     frame: str,
+    series: Tuple[pd.Series, pd.Series, int] | None = None,
 ) -> Path:
     """
     Create an overlay chart of historical vs forward annual interest (FY),
     splicing anchor-year as historical YTD + forward remainder.
+    ``series`` reuses an already composed (historical, forward, anchor_year) split.
     """
     out_dir.mkdir(parents=True, exist_ok=True)
-    cfg = load_macro_yaml(macro_path)
-    hist_fy = pd.read_csv(hist_fy_path)
-    hist_series, fwd_series, anchor_year = _compose_hist_vs_forward_series(
-        monthly_df, hist_fy, anchor_date=cfg.anchor_date, frame=frame
-    )
+    if series is None:
+        series = _hist_vs_forward(monthly_df, hist_fy_path, macro_path=macro_path, frame=frame)
+    hist_series, fwd_series, anchor_year = series
 
     # Plot
-    fig, ax = plt.subplots(figsize=(9, 4))
+    fig, ax = _new_axes()
     # Convert from USD millions to USD trillions for readability
     scale = 1_000_000.0
     ax.plot(hist_series.index, (hist_series.values / scale), label="Historical", color="tab:blue", marker="o")
@@ -239,7 +366,6 @@ def _plot_historical_vs_forward(
         "anchor_year": int(anchor_year),
     }
     p.with_suffix(".meta.json").write_text(json.dumps(meta, indent=2))
-    plt.close(fig)
     return p
 
 
@@ -250,18 +376,16 @@ def _plot_historical_vs_forward_pct_gdp(
     macro_path: str | Path,
     out_dir: Path,
     frame: str,
+    series: Tuple[pd.Series, pd.Series, int] | None = None,
 ) -> Path:
     """
     Plot historical vs forward as % of GDP for FY or CY.
     """
-    from macro.gdp import build_gdp_function
-
     out_dir.mkdir(parents=True, exist_ok=True)
     cfg = load_macro_yaml(macro_path)
-    hist = pd.read_csv(hist_path)
-    hist_series, fwd_series, anchor_year = _compose_hist_vs_forward_series(
-        monthly_df, hist, anchor_date=cfg.anchor_date, frame=frame
-    )
+    if series is None:
+        series = _hist_vs_forward(monthly_df, hist_path, macro_path=macro_path, frame=frame)
+    hist_series, fwd_series, anchor_year = series
     # Build GDP model using FY growth from config when available; otherwise flat
     years = list(hist_series.index)
     if years:
@@ -271,26 +395,7 @@ def _plot_historical_vs_forward_pct_gdp(
         min_year = int(cfg.gdp_anchor_fy)
         max_year = int(cfg.gdp_anchor_fy)
 
-    if getattr(cfg, "gdp_annual_fy_growth_rate", None):
-        # Config growth is percent; convert to decimals and fill coverage for [min_year, max_year+1]
-        provided = {int(y): float(v) / 100.0 for y, v in cfg.gdp_annual_fy_growth_rate.items()}
-        years_needed = list(range(min_year, max_year + 2))
-        # Forward-fill from earliest provided for years below; then step through years needed
-        if provided:
-            sorted_keys = sorted(provided)
-            current = provided.get(sorted_keys[0], 0.0)
-        else:
-            current = 0.0
-        growth_fy = {}
-        for y in years_needed:
-            if y in provided:
-                current = provided[y]
-            growth_fy[y] = current
-    else:
-        # Flat growth across coverage
-        growth_fy = {int(y): 0.0 for y in range(min_year, max_year + 2)}
-
-    gdp_model = build_gdp_function(cfg.anchor_date, cfg.gdp_anchor_value_usd_millions, growth_fy)
+    gdp_model = _gdp_model(macro_path, min_year, max_year)
     if frame == "FY":
         denom = hist_series.index.map(gdp_model.gdp_fy)
         title = "Historical vs Forward Interest (%GDP, FY)"
@@ -303,7 +408,7 @@ def _plot_historical_vs_forward_pct_gdp(
     hist_pct = hist_series / denom
     fwd_pct = fwd_series / denom
 
-    fig, ax = plt.subplots(figsize=(9, 4))
+    fig, ax = _new_axes()
     ax.plot(hist_pct.index, hist_pct.values, label="Historical", color="tab:blue", marker="o")
     ax.plot(fwd_pct.index, fwd_pct.values, label="Forward", color="tab:orange", marker="s")
     ax.set_title(title)
@@ -323,29 +428,33 @@ def _plot_historical_vs_forward_pct_gdp(
         "frame": frame,
     }
     p.with_suffix(".meta.json").write_text(json.dumps(meta, indent=2))
-    plt.close(fig)
     return p
 
 
 def build_bridge_table(monthly_df: pd.DataFrame, macro_path: str | Path) -> pd.DataFrame:
     cfg = load_macro_yaml(macro_path)
     anchor_fy = cfg.gdp_anchor_fy
-    def _fy_sum(col: str, fy: int) -> float:
-        mask = monthly_df.index.map(fiscal_year) == fy
-        return float(monthly_df.loc[mask, col].sum())
-    def _fy_avg_stock(fy: int) -> float:
-        mask = monthly_df.index.map(fiscal_year) == fy
-        return float(monthly_df.loc[mask, ["stock_short", "stock_nb", "stock_tips"]].sum(axis=1).mean())
-
     fy0, fy1 = anchor_fy, anchor_fy + 1
-    int0 = _fy_sum("interest_total", fy0)
-    int1 = _fy_sum("interest_total", fy1)
-    oth0 = _fy_sum("other_interest", fy0) if "other_interest" in monthly_df.columns else 0.0
-    oth1 = _fy_sum("other_interest", fy1) if "other_interest" in monthly_df.columns else 0.0
+    # One grouped pass over the trace: FY interest sums and FY mean of total stock
+    fy_keys = fiscal_year_series(monthly_df.index).to_numpy()
+    cols = {"interest_total": monthly_df["interest_total"].to_numpy(dtype=np.float64)}
+    if "other_interest" in monthly_df.columns:
+        cols["other_interest"] = monthly_df["other_interest"].to_numpy(dtype=np.float64)
+    cols["stock"] = np.nansum(monthly_df[STOCK_BUCKET_COLS].to_numpy(dtype=np.float64), axis=1)
+    how = {c: "sum" for c in cols}
+    how["stock"] = "mean"
+    by_fy = pd.DataFrame(cols).groupby(fy_keys).agg(how).reindex([fy0, fy1])
+    # Years without trace rows sum to zero (stock averages stay NaN)
+    sums = by_fy.drop(columns="stock").fillna(0.0)
+
+    int0 = float(sums.at[fy0, "interest_total"])
+    int1 = float(sums.at[fy1, "interest_total"])
+    oth0 = float(sums.at[fy0, "other_interest"]) if "other_interest" in sums.columns else 0.0
+    oth1 = float(sums.at[fy1, "other_interest"]) if "other_interest" in sums.columns else 0.0
     delta_total = (int1 + oth1) - (int0 + oth0)
 
-    avgS0 = _fy_avg_stock(fy0) or 1.0
-    avgS1 = _fy_avg_stock(fy1) or 1.0
+    avgS0 = float(by_fy.at[fy0, "stock"]) or 1.0
+    avgS1 = float(by_fy.at[fy1, "stock"]) or 1.0
     base0 = int0
     base1 = int1
     r0 = base0 / avgS0
@@ -401,49 +510,42 @@ def write_hist_forward_breakdown(
     hist_series, fwd_series, _anchor_year = _compose_hist_vs_forward_series(
         monthly_df, hist, anchor_date=anchor_date, frame=frame
     )
-    years = sorted(set(hist_series.index.tolist()) | set(fwd_series.index.tolist()))
-    hist_vals = pd.Series({y: float(hist_series.get(y)) for y in years})
-    fwd_vals = pd.Series({y: float(fwd_series.get(y)) for y in years})
-    # Build GDP per frame
-    def _safe_gdp_fy(y: int) -> float:
-        try:
-            return float(gdp_model.gdp_fy(int(y)))
-        except Exception:  # noqa: BLE001
-            return float("nan")
-    def _safe_gdp_cy(y: int) -> float:
-        try:
-            return float(gdp_model.gdp_cy(int(y)))
-        except Exception:  # noqa: BLE001
-            return float("nan")
+    years = hist_series.index.union(fwd_series.index)
+    hist_vals = hist_series.reindex(years).to_numpy(dtype=np.float64)
+    fwd_vals = fwd_series.reindex(years).to_numpy(dtype=np.float64)
+    # Build GDP per frame in one vectorized evaluation (NaN where growth is missing)
     if frame == "FY":
-        gdp_map = {int(y): _safe_gdp_fy(int(y)) for y in years}
+        gdp_vals = gdp_model.gdp_fy_array(years)
     else:
-        gdp_map = {int(y): _safe_gdp_cy(int(y)) for y in years}
+        gdp_vals = gdp_model.gdp_cy_array(years)
 
     out = pd.DataFrame(
         {
             "year": years,
-            "gdp": [gdp_map[int(y)] for y in years],
-            "interest_historical": [hist_vals.get(y) if pd.notna(hist_vals.get(y)) else float("nan") for y in years],
-            "interest_forward": [fwd_vals.get(y) if pd.notna(fwd_vals.get(y)) else float("nan") for y in years],
+            "gdp": gdp_vals,
+            "interest_historical": hist_vals,
+            "interest_forward": fwd_vals,
         }
     )
-    out["interest_total"] = out[["interest_historical", "interest_forward"]].fillna(0.0).sum(axis=1)
-    out["historical_pct_gdp"] = out["interest_historical"] / out["gdp"]
-    out["forward_pct_gdp"] = out["interest_forward"] / out["gdp"]
-    out["total_pct_gdp"] = out["interest_total"] / out["gdp"]
+    total_vals = np.nansum([hist_vals, fwd_vals], axis=0)
+    out["interest_total"] = total_vals
+    out["historical_pct_gdp"] = hist_vals / gdp_vals
+    out["forward_pct_gdp"] = fwd_vals / gdp_vals
+    out["total_pct_gdp"] = total_vals / gdp_vals
 
     # Optional effective rates per bucket and average (annualized effective levels)
     if hist_monthly_path is not None and stocks_path is not None:
         # Prepare monthly bucket interest and stocks
-        df = monthly_df.copy()
-        df.index = pd.to_datetime(pd.DatetimeIndex(df.index)).to_period("M").to_timestamp()
-        fwd_bucket = df[["interest_short", "interest_nb", "interest_tips"]].astype(float)
-        fwd_stocks = df[["stock_short", "stock_nb", "stock_tips"]].astype(float)
-        hm = pd.read_csv(hist_monthly_path, parse_dates=["Record Date"]).sort_values("Record Date")
-        hm["Record Date"] = hm["Record Date"].dt.to_period("M").dt.to_timestamp()
-        keep = hm[hm["Debt Category"].isin(["SHORT", "NB", "TIPS"])].copy()
-        hist_piv = keep.pivot_table(index="Record Date", columns="Debt Category", values="Interest Expense", aggfunc="sum").fillna(0.0)
+        fwd_bucket, fwd_stocks = _bucket_frames(monthly_df)
+        hm = _read_hist_monthly(hist_monthly_path)
+        keep = hm[hm["Debt Category"].isin(BUCKETS_ISSUANCE)]
+        hist_piv = (
+            keep.groupby(["Record Date", "Debt Category"], sort=False, observed=True)[
+                "Interest Expense"
+            ]
+            .sum()
+            .unstack(fill_value=0.0)
+        )
         hist_piv = hist_piv.rename(columns={"SHORT": "interest_short", "NB": "interest_nb", "TIPS": "interest_tips"})
         s = pd.read_csv(stocks_path, parse_dates=["Record Date"]).sort_values("Record Date")
         s["Record Date"] = s["Record Date"].dt.to_period("M").dt.to_timestamp()
@@ -471,34 +573,39 @@ def write_hist_forward_breakdown(
         _idx_f = pd.Index(months_all).intersection(fwd_stocks.index)
         if len(_idx_f) > 0:
             sb.loc[_idx_f, ["stock_short", "stock_nb", "stock_tips"]] = fwd_stocks.loc[_idx_f, ["stock_short", "stock_nb", "stock_tips"]]
-        # Annualize effective rates by summing interest and dividing by average stock per year
-        eff_short = []
-        eff_nb = []
-        eff_tips = []
-        eff_avg = []
-        for y in out["year"]:
-            if frame == "FY":
-                months = [d for d in months_all if fiscal_year(d) == int(y)]
-            else:
-                months = [d for d in months_all if pd.Timestamp(d).year == int(y)]
-            if not months:
-                eff_short.append(float("nan")); eff_nb.append(float("nan")); eff_tips.append(float("nan")); eff_avg.append(float("nan"))
+        # Annualize effective rates by summing interest and dividing by average stock per year.
+        # Per-year reductions fill pre-sized arrays (NaN for years with no months); the divisions
+        # and their zero/NaN guards then run once over the arrays.
+        years_out = out["year"].to_numpy()
+        n_years = len(years_out)
+        num = np.full((n_years, 3), np.nan)
+        den = np.full((n_years, 3), np.nan)
+        tot_i = np.full(n_years, np.nan)
+        tot_s = np.full(n_years, np.nan)
+        # Year key per month, computed once instead of per output year
+        months_idx = pd.DatetimeIndex(months_all)
+        month_keys = (
+            fiscal_year_series(months_idx).to_numpy()
+            if frame == "FY"
+            else months_idx.year.to_numpy()
+        )
+        for k, y in enumerate(years_out):
+            months = months_idx[month_keys == int(y)]
+            if len(months) == 0:
                 continue
             mb = ib.loc[months]
             sbm = sb.loc[months]
-            rs = mb["interest_short"].sum() / (sbm["stock_short"].mean() or float("nan"))
-            rn = mb["interest_nb"].sum() / (sbm["stock_nb"].mean() or float("nan"))
-            rt = mb["interest_tips"].sum() / (sbm["stock_tips"].mean() or float("nan"))
-            tot_i = mb[["interest_short", "interest_nb", "interest_tips"]].sum(axis=1).sum()
-            tot_s = sbm[["stock_short", "stock_nb", "stock_tips"]].sum(axis=1).mean()
-            ravg = tot_i / tot_s if pd.notna(tot_s) and tot_s not in (0.0,) else float("nan")
-            eff_short.append(float(rs) if pd.notna(rs) else float("nan"))
-            eff_nb.append(float(rn) if pd.notna(rn) else float("nan"))
-            eff_tips.append(float(rt) if pd.notna(rt) else float("nan"))
-            eff_avg.append(float(ravg) if pd.notna(ravg) else float("nan"))
-        out["eff_rate_short"] = eff_short
-        out["eff_rate_nb"] = eff_nb
-        out["eff_rate_tips"] = eff_tips
+            for j, b in enumerate(("short", "nb", "tips")):
+                num[k, j] = mb[f"interest_{b}"].sum()
+                den[k, j] = sbm[f"stock_{b}"].mean()
+            tot_i[k] = mb[["interest_short", "interest_nb", "interest_tips"]].sum(axis=1).sum()
+            tot_s[k] = sbm[["stock_short", "stock_nb", "stock_tips"]].sum(axis=1).mean()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            eff = np.where(den != 0.0, num / den, np.nan)
+            eff_avg = np.where(tot_s != 0.0, tot_i / tot_s, np.nan)
+        out["eff_rate_short"] = eff[:, 0]
+        out["eff_rate_nb"] = eff[:, 1]
+        out["eff_rate_tips"] = eff[:, 2]
         out["eff_rate_avg"] = eff_avg
 
     p = Path(out_path)
@@ -528,61 +635,48 @@ def write_hist_forward_breakdown_monthly(
     """
     if frame not in {"FY", "CY"}:
         raise ValueError("frame must be 'FY' or 'CY'")
-    # Normalize monthly_df index
-    df = monthly_df.copy()
-    df.index = pd.to_datetime(pd.DatetimeIndex(df.index)).to_period("M").to_timestamp()
-    # Include other_interest if present
-    total_col = "interest_total"
-    if "other_interest" in df.columns:
-        df["_total_interest"] = df["interest_total"].astype(float) + df["other_interest"].astype(float)
-        total_col = "_total_interest"
-
-    # Historical monthly totals (diagnostics file)
-    hm = pd.read_csv(hist_monthly_path)
-    # Expect 'Record Date' monthly and 'Interest Expense'
-    if "Record Date" not in hm.columns or "Interest Expense" not in hm.columns:
-        raise ValueError("historical monthly file missing expected columns")
-    hm["Record Date"] = pd.to_datetime(hm["Record Date"]).dt.to_period("M").dt.to_timestamp()
-    hist_m = hm.groupby("Record Date", as_index=True)["Interest Expense"].sum().astype(float)
+    # Month-start index and total interest (incl. other_interest if present)
+    # without copying the trace
+    idx = month_start(monthly_df.index)
+    total = pd.Series(_total_interest(monthly_df), index=idx)
+
+    # Historical monthly totals (diagnostics file; shared cached parse)
+    hm = _read_hist_monthly(hist_monthly_path)
+    hist_m = (
+        hm.groupby("Record Date", as_index=True)["Interest Expense"]
+        .sum()
+        .astype(np.float64, copy=False)
+    )
 
     # Anchor month boundary
     anchor = pd.Timestamp(anchor_date).to_period("M").to_timestamp()
 
     # Build calendar of months to cover: union of hist (<anchor) and forward (>=anchor)
-    months_hist = hist_m.index[hist_m.index < anchor]
-    months_fwd = df.index[df.index >= anchor]
-    all_months = pd.Index(sorted(set(months_hist.tolist()) | set(months_fwd.tolist())))
-
-    # Compute per-month values
-    hist_vals = pd.Series(0.0, index=all_months)
-    fwd_vals = pd.Series(0.0, index=all_months)
-    # Historical strictly before anchor
-    hist_vals.loc[months_hist] = hist_m.reindex(months_hist).fillna(0.0).astype(float).values
-    # Forward at/after anchor from projection
-    fwd_vals.loc[months_fwd] = df.loc[months_fwd, total_col].astype(float).values
-
-    # GDP mapping per frame
-    def _safe_gdp_fy(y: int) -> float:
-        try:
-            return float(gdp_model.gdp_fy(int(y)))
-        except Exception:  # noqa: BLE001
-            return float("nan")
-    def _safe_gdp_cy(y: int) -> float:
-        try:
-            return float(gdp_model.gdp_cy(int(y)))
-        except Exception:  # noqa: BLE001
-            return float("nan")
+    months_hist, _ = _split_at_anchor(hist_m.index, anchor)
+    _, months_fwd = _split_at_anchor(idx, anchor)
+    # The halves are disjoint (before vs at/after anchor), so sorted halves concatenate in order
+    all_months = months_hist.append(months_fwd.unique().sort_values())
+
+    # Per-month values: historical strictly before anchor, forward at/after anchor from projection
+    is_hist = all_months < anchor
+    hist_vals = np.where(
+        is_hist, hist_m.reindex(all_months).fillna(0.0).to_numpy(dtype=np.float64), 0.0
+    )
+    fwd_vals = np.where(is_hist, 0.0, total.reindex(all_months).to_numpy(dtype=np.float64))
+
+    # GDP mapping per frame: one vectorized evaluation over each month's year
+    month_idx = pd.DatetimeIndex(all_months)
     if frame == "FY":
-        gdp_vals = pd.Series({d: _safe_gdp_fy(int(fiscal_year(d))) for d in all_months})
+        gdp_vals = gdp_model.gdp_fy_array(fiscal_year_series(month_idx).to_numpy())
     else:
-        gdp_vals = pd.Series({d: _safe_gdp_cy(int(d.year)) for d in all_months})
+        gdp_vals = gdp_model.gdp_cy_array(month_idx.year.to_numpy())
 
     out = pd.DataFrame(
         {
             "date": all_months,
-            "gdp": gdp_vals.values,
-            "interest_historical": hist_vals.values,
-            "interest_forward": fwd_vals.values,
+            "gdp": gdp_vals,
+            "interest_historical": hist_vals,
+            "interest_forward": fwd_vals,
         }
     )
     out["interest_total"] = out[["interest_historical", "interest_forward"]].sum(axis=1)
@@ -593,29 +687,29 @@ def write_hist_forward_breakdown_monthly(
     # Optional effective rates per bucket and average (monthly values)
     if stocks_path is not None:
         # Historical bucket interest
-        hm2 = pd.read_csv(hist_monthly_path, parse_dates=["Record Date"]).sort_values("Record Date")
-        hm2["Record Date"] = hm2["Record Date"].dt.to_period("M").dt.to_timestamp()
-        piv_h = hm2.pivot_table(index="Record Date", columns="Debt Category", values="Interest Expense", aggfunc="sum").fillna(0.0)
+        piv_h = (
+            hm.groupby(["Record Date", "Debt Category"], sort=False, observed=True)[
+                "Interest Expense"
+            ]
+            .sum()
+            .unstack(fill_value=0.0)
+        )
         piv_h = piv_h.rename(columns={"SHORT": "interest_short", "NB": "interest_nb", "TIPS": "interest_tips"})
         # Forward bucket interest and stocks
-        df2 = monthly_df.copy()
-        df2.index = pd.to_datetime(pd.DatetimeIndex(df2.index)).to_period("M").to_timestamp()
-        fwd_b = df2[["interest_short", "interest_nb", "interest_tips"]].astype(float)
-        stocks_fwd = df2[["stock_short", "stock_nb", "stock_tips"]].astype(float)
+        fwd_b, stocks_fwd = _bucket_frames(monthly_df)
         # Stocks hist
         s = pd.read_csv(stocks_path, parse_dates=["Record Date"]).sort_values("Record Date")
         s["Record Date"] = s["Record Date"].dt.to_period("M").dt.to_timestamp()
         s = s.set_index("Record Date")[ ["stock_short", "stock_nb", "stock_tips"] ]
         # Combine per month
-        ishort = pd.Series(0.0, index=all_months)
-        inb = pd.Series(0.0, index=all_months)
-        itips = pd.Series(0.0, index=all_months)
-        ishort.loc[all_months[all_months < anchor]] = piv_h.reindex(all_months).fillna(0.0)["interest_short"].loc[all_months[all_months < anchor]].values
-        inb.loc[all_months[all_months < anchor]] = piv_h.reindex(all_months).fillna(0.0)["interest_nb"].loc[all_months[all_months < anchor]].values
-        itips.loc[all_months[all_months < anchor]] = piv_h.reindex(all_months).fillna(0.0)["interest_tips"].loc[all_months[all_months < anchor]].values
-        ishort.loc[all_months[all_months >= anchor]] = fwd_b.reindex(all_months).fillna(0.0)["interest_short"].loc[all_months[all_months >= anchor]].values
-        inb.loc[all_months[all_months >= anchor]] = fwd_b.reindex(all_months).fillna(0.0)["interest_nb"].loc[all_months[all_months >= anchor]].values
-        itips.loc[all_months[all_months >= anchor]] = fwd_b.reindex(all_months).fillna(0.0)["interest_tips"].loc[all_months[all_months >= anchor]].values
+        hist_b = piv_h.reindex(all_months).fillna(0.0)
+        fwd_bb = fwd_b.reindex(all_months).fillna(0.0)
+        ishort, inb, itips = (
+            pd.Series(
+                np.where(is_hist, hist_b[c].to_numpy(), fwd_bb[c].to_numpy()), index=all_months
+            )
+            for c in INTEREST_BUCKET_COLS
+        )
         sshort = pd.Series(float("nan"), index=all_months)
         snb = pd.Series(float("nan"), index=all_months)
         stips = pd.Series(float("nan"), index=all_months)
@@ -629,10 +723,10 @@ def write_hist_forward_breakdown_monthly(
             sshort.loc[_idx_fwd] = stocks_fwd.loc[_idx_fwd, "stock_short"]
             snb.loc[_idx_fwd] = stocks_fwd.loc[_idx_fwd, "stock_nb"]
             stips.loc[_idx_fwd] = stocks_fwd.loc[_idx_fwd, "stock_tips"]
-        out["eff_rate_short"] = (ishort / sshort).astype(float)
-        out["eff_rate_nb"] = (inb / snb).astype(float)
-        out["eff_rate_tips"] = (itips / stips).astype(float)
-        out["eff_rate_avg"] = ((ishort + inb + itips) / (sshort + snb + stips)).astype(float)
+        out["eff_rate_short"] = ishort / sshort
+        out["eff_rate_nb"] = inb / snb
+        out["eff_rate_tips"] = itips / stips
+        out["eff_rate_avg"] = (ishort + inb + itips) / (sshort + snb + stips)
 
     p = Path(out_path)
     p.parent.mkdir(parents=True, exist_ok=True)
@@ -650,18 +744,21 @@ def write_historical_shares(
     Output columns: date, share_short, share_nb, share_tips
     where shares are interest by bucket divided by sum over SHORT/NB/TIPS for that month.
     """
-    df = pd.read_csv(hist_monthly_path, parse_dates=["Record Date"]).sort_values("Record Date")
-    keep = df[df["Debt Category"].isin(["SHORT", "NB", "TIPS"])].copy()
-    keep["Record Date"] = keep["Record Date"].dt.to_period("M").dt.to_timestamp()
-    piv = keep.pivot_table(
-        index="Record Date", columns="Debt Category", values="Interest Expense", aggfunc="sum"
-    ).fillna(0.0)
+    df = _read_hist_monthly(hist_monthly_path)
+    keep = df[df["Debt Category"].isin(BUCKETS_ISSUANCE)]
+    piv = (
+        keep.groupby(["Record Date", "Debt Category"], sort=False, observed=True)[
+            "Interest Expense"
+        ]
+        .sum()
+        .unstack(fill_value=0.0)
+    )
     piv = piv.rename(columns={"SHORT": "short", "NB": "nb", "TIPS": "tips"})
-    total = piv[["short", "nb", "tips"]].sum(axis=1).replace(0.0, pd.NA)
+    total = piv[["short", "nb", "tips"]].sum(axis=1).replace(0.0, np.nan)
     shares = pd.DataFrame(index=piv.index)
-    shares["share_short"] = (piv["short"] / total).astype(float)
-    shares["share_nb"] = (piv["nb"] / total).astype(float)
-    shares["share_tips"] = (piv["tips"] / total).astype(float)
+    shares["share_short"] = piv["short"] / total
+    shares["share_nb"] = piv["nb"] / total
+    shares["share_tips"] = piv["tips"] / total
     shares = shares.reset_index().rename(columns={"Record Date": "date"})
     p = Path(out_path)
     p.parent.mkdir(parents=True, exist_ok=True)
@@ -683,13 +780,18 @@ def write_historical_effective_rates(
       rate_short_a, rate_nb_a, rate_tips_a, rate_total_a
     """
     # Interest by category
-    df = pd.read_csv(hist_monthly_path, parse_dates=["Record Date"]).sort_values("Record Date")
-    keep = df[df["Debt Category"].isin(["SHORT", "NB", "TIPS"])].copy()
-    keep["Record Date"] = keep["Record Date"].dt.to_period("M").dt.to_timestamp()
-    piv = keep.pivot_table(
-        index="Record Date", columns="Debt Category", values="Interest Expense", aggfunc="sum"
-    ).fillna(0.0)
-    piv = piv.rename(columns={"SHORT": "interest_short", "NB": "interest_nb", "TIPS": "interest_tips"})
+    df = _read_hist_monthly(hist_monthly_path)
+    keep = df[df["Debt Category"].isin(BUCKETS_ISSUANCE)]
+    # Categorical groupby over the fixed bucket set; absent buckets become zero columns
+    piv = (
+        keep.groupby(["Record Date", "Debt Category"], sort=False, observed=True)[
+            "Interest Expense"
+        ]
+        .sum()
+        .unstack("Debt Category", fill_value=0.0)
+        .reindex(columns=list(BUCKETS_ISSUANCE), fill_value=0.0)
+    )
+    piv.columns = ["interest_short", "interest_nb", "interest_tips"]
 
     # Stocks by bucket (scaled)
     s = pd.read_csv(stocks_path, parse_dates=["Record Date"]).sort_values("Record Date")
@@ -698,30 +800,175 @@ def write_historical_effective_rates(
 
     merged = piv.join(s, how="inner")
     # Effective monthly rates
-    rate_short_m = (merged["interest_short"] / merged["stock_short"]).astype(float)
-    rate_nb_m = (merged["interest_nb"] / merged["stock_nb"]).astype(float)
-    rate_tips_m = (merged["interest_tips"] / merged["stock_tips"]).astype(float)
+    rate_short_m = merged["interest_short"] / merged["stock_short"]
+    rate_nb_m = merged["interest_nb"] / merged["stock_nb"]
+    rate_tips_m = merged["interest_tips"] / merged["stock_tips"]
     total_interest = merged[["interest_short", "interest_nb", "interest_tips"]].sum(axis=1)
-    total_stock = merged[["stock_short", "stock_nb", "stock_tips"]].sum(axis=1).replace(0.0, pd.NA)
-    rate_total_m = (total_interest / total_stock).astype(float)
-
-    out = pd.DataFrame(
-        {
-            "date": merged.index,
-            "rate_short_m": rate_short_m.values,
-            "rate_nb_m": rate_nb_m.values,
-            "rate_tips_m": rate_tips_m.values,
-            "rate_total_m": rate_total_m.values,
-        }
-    )
-    for col in ["rate_short_m", "rate_nb_m", "rate_tips_m", "rate_total_m"]:
-        out[col.replace("_m", "_a")] = out[col] * 12.0
+    total_stock = merged[["stock_short", "stock_nb", "stock_tips"]].sum(axis=1).replace(0.0, np.nan)
+    rate_total_m = total_interest / total_stock
+
+    monthly_rates = {
+        "rate_short_m": rate_short_m.to_numpy(),
+        "rate_nb_m": rate_nb_m.to_numpy(),
+        "rate_tips_m": rate_tips_m.to_numpy(),
+        "rate_total_m": rate_total_m.to_numpy(),
+    }
+    # Annualized companions go into the same constructor (one block, no per-column inserts)
+    annual_rates = {col[:-2] + "_a": vals * 12.0 for col, vals in monthly_rates.items()}
+    out = pd.DataFrame({"date": merged.index, **monthly_rates, **annual_rates})
     p = Path(out_path)
     p.parent.mkdir(parents=True, exist_ok=True)
     out.to_csv(p, index=False)
     return p
 
 
+# Bump when chart drawing code changes so fingerprinted PNGs on disk are re-rendered
+QA_PLOT_CACHE_VERSION = 1
+
+
+def _fingerprint(*parts: object) -> str:
+    """Digest of plot inputs: frames hash by index and values, everything else by repr."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, pd.DataFrame):
+            h.update(repr(list(part.columns)).encode())
+            h.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+        else:
+            h.update(repr(part).encode())
+    return h.hexdigest()
+
+
+def _cached_plot(stamp: Path, digest: str) -> Path | None:
+    """Return the chart recorded in ``stamp`` if it matches ``digest`` and its files still exist."""
+    try:
+        saved = json.loads(stamp.read_text())
+    except (OSError, ValueError):
+        return None
+    files = [Path(f) for f in saved.get("files", [])]
+    if saved.get("digest") != digest or not files or not all(f.exists() for f in files):
+        return None
+    return files[0]
+
+
+def _render_and_stamp(
+    stamp: Path, digest: str, fn: Callable[..., Path], *args: Any, **kwargs: Any
+) -> Path:
+    p = fn(*args, **kwargs)
+    files = [p] + [m for m in (p.with_suffix(".meta.json"),) if m.exists()]
+    stamp.write_text(json.dumps({"digest": digest, "files": [str(f) for f in files]}))
+    return p
+
+
+def render_all(
+    monthly_df: pd.DataFrame,
+    *,
+    annual_cy_path: str | Path,
+    annual_fy_path: str | Path,
+    macro_path: str | Path,
+    base: Path,
+    max_workers: int | None = None,
+    reuse: bool = False,
+) -> Dict[str, Path]:
+    """
+    Render all QA visuals concurrently and return their paths keyed by chart name.
+
+    Each helper builds and saves its own Figure, so they are independent and can run on
+    a thread pool; Agg rasterization and PNG encoding overlap across charts.
+    With ``reuse``, a chart whose input fingerprint matches its ``<name>.hash`` stamp
+    (and whose files still exist) is not re-rendered. The fingerprint covers inputs, not
+    plotting code, so it is opt-in; bump ``QA_PLOT_CACHE_VERSION`` when a plotter changes.
+    """
+    cy_vis_dir = base / "calendar_year" / "visualizations"
+    fy_vis_dir = base / "fiscal_year" / "visualizations"
+    hist_fy = base / "diagnostics" / "interest_fy_totals.csv"
+    hist_cy = base / "diagnostics" / "interest_cy_totals.csv"
+    fy_overlay = {"macro_path": macro_path, "out_dir": fy_vis_dir, "frame": "FY"}
+    cy_overlay = {"macro_path": macro_path, "out_dir": cy_vis_dir, "frame": "CY"}
+    # name -> (plotter, args, kwargs, output dir, fingerprint inputs beyond the trace)
+    jobs = {
+        "monthly_interest": (_plot_monthly_interest, (monthly_df, cy_vis_dir), {}, cy_vis_dir, ()),
+        "effective_rate": (_plot_effective_rate, (monthly_df, fy_vis_dir), {}, fy_vis_dir, ()),
+        "annual_cy": (
+            _plot_annual,
+            (annual_cy_path, cy_vis_dir, "Annual CY Interest and %GDP"),
+            {},
+            cy_vis_dir,
+            (_file_key(annual_cy_path), "Annual CY Interest and %GDP"),
+        ),
+        "annual_fy": (
+            _plot_annual,
+            (annual_fy_path, fy_vis_dir, "Annual FY Interest and %GDP"),
+            {},
+            fy_vis_dir,
+            (_file_key(annual_fy_path), "Annual FY Interest and %GDP"),
+        ),
+        "historical_vs_forward_fy": (
+            _plot_historical_vs_forward,
+            (monthly_df, hist_fy),
+            fy_overlay,
+            fy_vis_dir,
+            (_file_key(hist_fy), _file_key(macro_path), "FY"),
+        ),
+        "historical_vs_forward_cy": (
+            _plot_historical_vs_forward,
+            (monthly_df, hist_cy),
+            cy_overlay,
+            cy_vis_dir,
+            (_file_key(hist_cy), _file_key(macro_path), "CY"),
+        ),
+        "historical_vs_forward_pct_gdp_fy": (
+            _plot_historical_vs_forward_pct_gdp,
+            (monthly_df, hist_fy),
+            fy_overlay,
+            fy_vis_dir,
+            (_file_key(hist_fy), _file_key(macro_path), "FY"),
+        ),
+        "historical_vs_forward_pct_gdp_cy": (
+            _plot_historical_vs_forward_pct_gdp,
+            (monthly_df, hist_cy),
+            cy_overlay,
+            cy_vis_dir,
+            (_file_key(hist_cy), _file_key(macro_path), "CY"),
+        ),
+    }
+    trace_fp = _fingerprint(monthly_df)
+    results: Dict[str, Path] = {}
+    pending = {}
+    for name, (fn, args, kwargs, out_dir, inputs) in jobs.items():
+        digest = _fingerprint(
+            QA_PLOT_CACHE_VERSION, matplotlib.__version__, QA_RC_PARAMS, trace_fp, *inputs
+        )
+        stamp = out_dir / f"{name}.hash"
+        cached = _cached_plot(stamp, digest) if reuse else None
+        if cached is not None:
+            results[name] = cached
+        else:
+            pending[name] = (fn, args, kwargs, stamp, digest)
+    if not pending:
+        return results
+    workers = max_workers or min(QA_MAX_WORKERS, len(pending), os.cpu_count() or 1)
+    with matplotlib.rc_context(QA_RC_PARAMS), ThreadPoolExecutor(max_workers=workers) as pool:
+        # Charts that do not need the historical split go first, so a bad historical totals
+        # file cannot keep them from being written
+        futures = {
+            name: pool.submit(_render_and_stamp, stamp, digest, fn, *args, **kwargs)
+            for name, (fn, args, kwargs, stamp, digest) in pending.items()
+            if "frame" not in kwargs
+        }
+        # Compose each frame's historical/forward split once (only if one of its overlays renders)
+        series = {
+            frame: _hist_vs_forward(monthly_df, hist_path, macro_path=macro_path, frame=frame)
+            for frame, hist_path in (("FY", hist_fy), ("CY", hist_cy))
+            if any(job[2].get("frame") == frame for job in pending.values())
+        }
+        for name, (fn, args, kwargs, stamp, digest) in pending.items():
+            if "frame" in kwargs:
+                kwargs = {**kwargs, "series": series[kwargs["frame"]]}
+                futures[name] = pool.submit(_render_and_stamp, stamp, digest, fn, *args, **kwargs)
+        results.update({name: fut.result() for name, fut in futures.items()})
+    return {name: results[name] for name in jobs}
+
+
 def run_qa(
     monthly_trace_path: str | Path = "output/diagnostics/monthly_trace.parquet",
     annual_cy_path: str | Path = "output/calendar_year/spreadsheets/annual.csv",
@@ -729,50 +976,19 @@ def run_qa(
     macro_path: str | Path = "input/macro.yaml",
     out_base: str | Path | None = None,
 ) -> Tuple[Path, Path, Path]:
-    monthly = _read_monthly_trace(monthly_trace_path)
-    # Plots (route to out_base if provided)
+    monthly = _read_monthly_trace(monthly_trace_path, columns=QA_TRACE_COLUMNS)
+    # Plots (route to out_base if provided): monthly/effective, annual FY/CY, and overlays
     base = Path(out_base) if out_base is not None else Path("output")
-    cy_vis_dir = base / "calendar_year" / "visualizations"
-    fy_vis_dir = base / "fiscal_year" / "visualizations"
-    # FY/CY and pctGDP variants
-    p1 = _plot_monthly_interest(monthly, cy_vis_dir)
-    p2 = _plot_effective_rate(monthly, fy_vis_dir)
-    _plot_annual(annual_cy_path, cy_vis_dir, "Annual CY Interest and %GDP")
-    _plot_annual(annual_fy_path, fy_vis_dir, "Annual FY Interest and %GDP")
-    # Historical vs Forward overlays
-    _plot_historical_vs_forward(
-        monthly,
-        hist_fy_path=base / "diagnostics" / "interest_fy_totals.csv",
-        macro_path=macro_path,
-        out_dir=fy_vis_dir,
-        frame="FY",
-    )
-    _plot_historical_vs_forward(
+    plots = render_all(
         monthly,
-        hist_fy_path=base / "diagnostics" / "interest_cy_totals.csv",
+        annual_cy_path=annual_cy_path,
+        annual_fy_path=annual_fy_path,
         macro_path=macro_path,
-        out_dir=cy_vis_dir,
-        frame="CY",
-    )
-    _plot_historical_vs_forward_pct_gdp(
-        monthly,
-        hist_path=base / "diagnostics" / "interest_fy_totals.csv",
-        macro_path=macro_path,
-        out_dir=fy_vis_dir,
-        frame="FY",
-    )
-    _plot_historical_vs_forward_pct_gdp(
-        monthly,
-        hist_path=base / "diagnostics" / "interest_cy_totals.csv",
-        macro_path=macro_path,
-        out_dir=cy_vis_dir,
-        frame="CY",
+        base=base,
     )
     # Bridge
     bridge = build_bridge_table(monthly, macro_path)
     bridge_path = (base / "diagnostics" / "bridge_table.csv")
     bridge_path.parent.mkdir(parents=True, exist_ok=True)
     bridge.to_csv(bridge_path, index=False)
-    return p1, p2, bridge_path
-
-
+    return plots["monthly_interest"], plots["effective_rate"], bridge_path
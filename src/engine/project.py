@@ -2,15 +2,127 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Mapping, Tuple
+from typing import Dict, Iterable, Mapping, Tuple
 
+import numpy as np
 import pandas as pd
 
+from core.io_utils import write_trace
 from macro.rates import build_month_index
 from macro.issuance import FixedSharesPolicy
 from .state import DebtState
-from .accrual import compute_interest
-from .transitions import update_state, compute_redemptions
+
+
+BUCKETS = ("short", "nb", "tips")
+
+
+try:  # optional: JIT-compiled recurrence
+    from numba import njit
+except ImportError:  # pragma: no cover - pure-Python loop below
+    njit = None
+
+
+SIM_COLUMNS = (
+    "stock_short", "stock_nb", "stock_tips",
+    "interest_short", "interest_nb", "interest_tips", "interest_total",
+    "gfn", "redemptions_short", "redemptions_nb", "redemptions_tips", "redemptions_total",
+)
+
+
+def _recurrence(  # type: ignore[no-untyped-def]
+    r_s, r_n, r_t, sh_s, sh_n, sh_t, d, o, s_short, s_nb, s_tips, decay_nb, decay_tips
+):
+    """
+    Month-by-month debt recurrence; returns the SIM_COLUMNS arrays in order.
+
+    Same arithmetic, in the same order, as compute_interest / compute_redemptions /
+    update_state applied per step. Kept numba-compatible (arrays in, arrays out).
+    """
+    n = len(d)
+    stock_short = np.empty(n)
+    stock_nb = np.empty(n)
+    stock_tips = np.empty(n)
+    int_short = np.empty(n)
+    int_nb = np.empty(n)
+    int_tips = np.empty(n)
+    int_total = np.empty(n)
+    gfn_out = np.empty(n)
+    red_short_out = np.empty(n)
+    red_nb_out = np.empty(n)
+    red_tips_out = np.empty(n)
+    red_total_out = np.empty(n)
+    for i in range(n):
+        stock_short[i] = s_short
+        stock_nb[i] = s_nb
+        stock_tips[i] = s_tips
+        # Interest on opening stock
+        i_short = s_short * r_s[i]
+        i_nb = s_nb * r_n[i]
+        i_tips = s_tips * r_t[i]
+        i_total = i_short + i_nb + i_tips
+        # Redemptions: bills roll fully; NB/TIPS decay
+        red_short = s_short
+        red_nb = s_nb * decay_nb
+        red_tips = s_tips * decay_tips
+        red_total = red_short + red_nb + red_tips
+        # Budget identity: GFN = primary_deficit + interest + redemptions
+        gfn = d[i] + i_total + o[i] + red_total
+        int_short[i] = i_short
+        int_nb[i] = i_nb
+        int_tips[i] = i_tips
+        int_total[i] = i_total
+        gfn_out[i] = gfn
+        red_short_out[i] = red_short
+        red_nb_out[i] = red_nb
+        red_tips_out[i] = red_tips
+        red_total_out[i] = red_total
+        # State update with redemptions/decay plus new issuance
+        s_short = s_short - red_short + sh_s[i] * gfn
+        s_nb = s_nb - red_nb + sh_n[i] * gfn
+        s_tips = s_tips - red_tips + sh_t[i] * gfn
+    return (
+        stock_short, stock_nb, stock_tips,
+        int_short, int_nb, int_tips, int_total,
+        gfn_out, red_short_out, red_nb_out, red_tips_out, red_total_out,
+    )
+
+
+# No fastmath: reassociating the sums would break exact agreement with the per-step engine
+_recurrence_jit = njit(_recurrence) if njit is not None else None
+
+
+def _simulate(
+    rates_m: np.ndarray,
+    shares: np.ndarray,
+    deficits: np.ndarray,
+    other: np.ndarray,
+    start: Tuple[float, float, float],
+    decay_nb: float,
+    decay_tips: float,
+) -> Dict[str, np.ndarray]:
+    """Run the recurrence on n x 3 monthly rates/shares and n-vector deficits/other interest."""
+    s0 = tuple(float(v) for v in start)
+    if _recurrence_jit is not None:
+        cols = [np.ascontiguousarray(a[:, k]) for a in (rates_m, shares) for k in range(3)]
+        res = _recurrence_jit(
+            *cols,
+            np.ascontiguousarray(deficits),
+            np.ascontiguousarray(other),
+            *s0,
+            decay_nb,
+            decay_tips,
+        )
+    else:
+        # Python floats in the interpreted loop (numpy scalar indexing is several times slower)
+        cols = [a[:, k].tolist() for a in (rates_m, shares) for k in range(3)]
+        res = _recurrence(*cols, deficits.tolist(), other.tolist(), *s0, decay_nb, decay_tips)
+    return dict(zip(SIM_COLUMNS, res))
+
+
+def _bucket_matrix(provider: object, idx: pd.DatetimeIndex) -> np.ndarray:
+    """Fresh n x 3 float64 matrix of provider.get(idx) in BUCKETS order."""
+    frame = provider.get(idx)  # type: ignore[attr-defined]
+    return frame.loc[idx, list(BUCKETS)].to_numpy(dtype=np.float64, copy=True)
 
 
 @dataclass
@@ -32,62 +144,56 @@ class ProjectionEngine:
         trace_out_path: str | Path | None = None,
     ) -> pd.DataFrame:
         idx = pd.to_datetime(pd.DatetimeIndex(index)).to_period("M").to_timestamp()
-        rates = self.rates_provider.get(idx)
-        shares = self.issuance_policy.get(idx)
-        deficits = deficits_monthly.reindex(idx).fillna(0.0)
-        other = (other_interest_monthly.reindex(idx).fillna(0.0)) if other_interest_monthly is not None else pd.Series(0.0, index=idx)
-
-        rows = []
-        state = start_state
-        for dt in idx:
-            r_row = rates.loc[dt]
-            sh_row = shares.loc[dt]
-            # Compute interest
-            acc = compute_interest(
-                state,
-                r_row,
-                coupon_nb_existing_annual=coupon_nb_existing_annual,
-                coupon_tips_existing_annual=coupon_tips_existing_annual,
-            )
-            # Redemptions
-            red_short, red_nb, red_tips = compute_redemptions(state, decay_nb, decay_tips)
-            red_total = red_short + red_nb + red_tips
-            # Budget identity: GFN = primary_deficit + interest + redemptions
-            gfn = float(deficits.loc[dt]) + acc["interest_total"] + float(other.loc[dt]) + red_total
-            new_short = float(sh_row["short"]) * gfn
-            new_nb = float(sh_row["nb"]) * gfn
-            new_tips = float(sh_row["tips"]) * gfn
-
-            rows.append(
-                {
-                    "date": dt,
-                    "stock_short": state.stock_short,
-                    "stock_nb": state.stock_nb,
-                    "stock_tips": state.stock_tips,
-                    **acc,
-                    "other_interest": float(other.loc[dt]),
-                    "shares_short": float(sh_row["short"]),
-                    "shares_nb": float(sh_row["nb"]),
-                    "shares_tips": float(sh_row["tips"]),
-                    "gfn": gfn,
-                    "redemptions_short": red_short,
-                    "redemptions_nb": red_nb,
-                    "redemptions_tips": red_tips,
-                    "redemptions_total": red_total,
-                }
-            )
-
-            # State update with redemptions/decay
-            state = update_state(state, new_short, new_nb, new_tips, decay_nb=decay_nb, decay_tips=decay_tips)
-
-        df = pd.DataFrame(rows).set_index("date")
+        rates_m = _bucket_matrix(self.rates_provider, idx)
+        shares_arr = _bucket_matrix(self.issuance_policy, idx)
+        deficits_arr = deficits_monthly.reindex(idx).to_numpy(dtype=np.float64, na_value=0.0)
+        if other_interest_monthly is not None:
+            other_arr = other_interest_monthly.reindex(idx).to_numpy(dtype=np.float64, na_value=0.0)
+        else:
+            other_arr = np.zeros(len(idx), dtype=np.float64)
+
+        # Monthly rates per bucket; existing NB/TIPS coupons override the curve when given
+        if coupon_nb_existing_annual is not None:
+            rates_m[:, 1] = float(coupon_nb_existing_annual)
+        if coupon_tips_existing_annual is not None:
+            rates_m[:, 2] = float(coupon_tips_existing_annual)
+        rates_m /= 12.0
+        sim = _simulate(
+            rates_m,
+            shares_arr,
+            deficits_arr,
+            other_arr,
+            (start_state.stock_short, start_state.stock_nb, start_state.stock_tips),
+            float(decay_nb),
+            float(decay_tips),
+        )
+
+        # Assemble the trace once from columns (column order is part of the trace contract)
+        df = pd.DataFrame(
+            {
+                "stock_short": sim["stock_short"],
+                "stock_nb": sim["stock_nb"],
+                "stock_tips": sim["stock_tips"],
+                "interest_short": sim["interest_short"],
+                "interest_nb": sim["interest_nb"],
+                "interest_tips": sim["interest_tips"],
+                "interest_total": sim["interest_total"],
+                "other_interest": other_arr,
+                "shares_short": shares_arr[:, 0],
+                "shares_nb": shares_arr[:, 1],
+                "shares_tips": shares_arr[:, 2],
+                "gfn": sim["gfn"],
+                "redemptions_short": sim["redemptions_short"],
+                "redemptions_nb": sim["redemptions_nb"],
+                "redemptions_tips": sim["redemptions_tips"],
+                "redemptions_total": sim["redemptions_total"],
+            },
+            index=pd.DatetimeIndex(idx.to_numpy(), name="date"),
+            copy=False,
+        )
         out = Path(trace_out_path) if trace_out_path is not None else Path("output/diagnostics/monthly_trace.parquet")
         out.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            df.to_parquet(out)
-        except Exception:
-            # Fallback to CSV if parquet deps missing
-            df.to_csv(out.with_suffix(".csv"))
+        write_trace(df, out)
         return df
 
 
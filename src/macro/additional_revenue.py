@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Dict, Tuple, List, Optional
 
+import numpy as np
 import pandas as pd
 
-from core.dates import fiscal_year
+from core.dates import fiscal_year_series
+from core.io_utils import write_preview
 from macro.config import MacroConfig
 from macro.gdp import GDPModel
+from macro.series_utils import constant_category, fill_year_map
+
+
 def _compute_cumulative_factors(
     years: List[int],
     anchor_year: int,
@@ -32,37 +38,44 @@ def _compute_cumulative_factors(
         return factors
 
     series = (pce or {}) if idx == "pce" else (cpi or {})
-    # Pre-fill rates by carrying last known forward for requested years
-    all_years = sorted(set(years + list(series.keys())))
-    carried: Dict[int, float] = {}
-    last = float(series.get(min(series.keys()) if series else (anchor_year + 1), 0.0))
-    for y in all_years:
-        if y in series:
-            last = float(series[y])
-        carried[y] = last
-
-    # Build cumulative product from anchor_year+1 upward
-    cumulative = 1.0
-    for y in sorted(all_years):
-        if y <= anchor_year:
-            continue
-        rate_pct = float(carried.get(y, 0.0))
-        cumulative *= (1.0 + (rate_pct / 100.0))
-        if y in years:
-            factors[y] = cumulative
-
-    # Ensure all requested years have entries
-    for y in years:
-        if y == anchor_year:
-            factors[y] = 1.0
-        elif y < anchor_year and y not in factors:
-            factors[y] = 1.0
-        elif y > anchor_year and y not in factors:
-            # If beyond provided series, keep last cumulative
-            factors[y] = cumulative if cumulative != 0.0 else 1.0
+    # The revenue series and its preview ask for the same factors; memoize on hashable inputs
+    cumulative = _cumulative_factors_cached(
+        tuple(int(y) for y in years),
+        int(anchor_year),
+        tuple(sorted((int(k), float(v)) for k, v in series.items())),
+    )
+    for y, c in zip(years, cumulative):
+        factors[y] = c if y > anchor_year else 1.0
     return factors
 
 
+@functools.lru_cache(maxsize=32)
+def _cumulative_factors_cached(
+    years: Tuple[int, ...],
+    anchor_year: int,
+    series: Tuple[Tuple[int, float], ...],
+) -> Tuple[float, ...]:
+    """Cumulative index factor for each of ``years`` given sorted (year, rate %) pairs."""
+    series_map = dict(series)
+    # Rates carried forward over the union of requested and provided years
+    # (earliest value backfills)
+    all_years = np.union1d(
+        np.asarray(years, dtype=np.int64),
+        np.fromiter(series_map.keys(), dtype=np.int64, count=len(series_map)),
+    )
+    carried = np.fromiter(
+        fill_year_map(series_map, all_years.tolist()).values(),
+        dtype=np.float64,
+        count=len(all_years),
+    )
+
+    # Cumulative product from anchor_year+1 upward; years at/before the anchor stay at 1.0
+    growth = np.where(all_years > anchor_year, 1.0 + (carried / 100.0), 1.0)
+    cumulative = np.multiply.accumulate(growth)
+    pos = np.searchsorted(all_years, np.asarray(years, dtype=np.int64))
+    return tuple(cumulative[pos].tolist())
+
+
 def build_inflation_index_preview(
     cfg: MacroConfig,
     years_needed: List[int],
@@ -80,45 +93,40 @@ def build_inflation_index_preview(
     if anchor_year is None or anchor_amount is None or index_kind is None:
         return None
 
+    kind = str(index_kind).lower()
     pce = getattr(cfg, "inflation_pce", None)
     cpi = getattr(cfg, "inflation_cpi", None)
-    factors = _compute_cumulative_factors(years_needed, int(anchor_year), str(index_kind), pce, cpi)
-
-    rows = []
-    for y in years_needed:
-        rate_map = pce if str(index_kind).lower() == "pce" else cpi if str(index_kind).lower() == "cpi" else {}
-        rate_pct = 0.0
-        if str(index_kind).lower() in {"pce", "cpi"} and y > int(anchor_year):
-            rate_pct = float((rate_map or {}).get(int(y), 0.0))
-        indexed_val = float(anchor_amount) * float(factors.get(int(y), 1.0)) if y >= int(anchor_year) else float(anchor_amount)
-        rows.append(
-            {
-                "frame": cfg.deficits_frame,
-                "year_key": int(y),
-                "mode": mode,
-                "index": str(index_kind).lower(),
-                "anchor_year": int(anchor_year),
-                "anchor_amount": float(anchor_amount),
-                "inflation_source": ("PCE" if str(index_kind).lower() == "pce" else "CPI" if str(index_kind).lower() == "cpi" else "None"),
-                "inflation_rate_pct": float(rate_pct),
-                "cumulative_factor": float(factors.get(int(y), 1.0)),
-                "indexed_value_unit": float(indexed_val),
-            }
-        )
-    return pd.DataFrame(rows)
-
-
-def _fill_year_map(values: Dict[int, float], years_needed: list[int]) -> Dict[int, float]:
-    if not values:
-        return {y: 0.0 for y in years_needed}
-    filled: Dict[int, float] = {}
-    sorted_years = sorted(set([*years_needed, *values.keys()]))
-    current = values.get(min(values.keys()), 0.0)
-    for y in sorted_years:
-        if y in values:
-            current = float(values[y])
-        filled[y] = current
-    return {y: filled[y] for y in years_needed}
+    anchor_y = int(anchor_year)
+    anchor_amt = float(anchor_amount)
+    factors = _compute_cumulative_factors(years_needed, anchor_y, kind, pce, cpi)
+
+    rate_map = (pce if kind == "pce" else cpi if kind == "cpi" else {}) or {}
+    # Per-year columns; scalar fields broadcast across rows
+    rate_pct = [
+        float(rate_map.get(int(y), 0.0)) if kind in {"pce", "cpi"} and y > anchor_y else 0.0
+        for y in years_needed
+    ]
+    factor = [float(factors.get(int(y), 1.0)) for y in years_needed]
+    indexed = [
+        anchor_amt * f if y >= anchor_y else anchor_amt for y, f in zip(years_needed, factor)
+    ]
+    n = len(years_needed)
+    return pd.DataFrame(
+        {
+            "frame": constant_category(cfg.deficits_frame, n),
+            "year_key": np.asarray(years_needed, dtype=np.int64),
+            "mode": constant_category(mode, n),
+            "index": constant_category(kind, n),
+            "anchor_year": anchor_y,
+            "anchor_amount": anchor_amt,
+            "inflation_source": constant_category(
+                "PCE" if kind == "pce" else "CPI" if kind == "cpi" else "None", n
+            ),
+            "inflation_rate_pct": np.asarray(rate_pct, dtype=np.float64),
+            "cumulative_factor": np.asarray(factor, dtype=np.float64),
+            "indexed_value_unit": np.asarray(indexed, dtype=np.float64),
+        }
+    )
 
 
 def build_additional_revenue_series(
@@ -143,14 +151,23 @@ def build_additional_revenue_series(
 
     idx = pd.to_datetime(pd.DatetimeIndex(index)).to_period("M").to_timestamp()
 
-    # Determine coverage years needed for frame
+    # Year key per month for the frame (computed once; reused for coverage and per-month columns)
     if cfg.deficits_frame == "FY":
-        years_needed = sorted(set([fiscal_year(d) for d in idx]))
+        year_keys = fiscal_year_series(idx).to_numpy()
     else:
-        years_needed = sorted(set([d.year for d in idx]))
+        year_keys = idx.year.to_numpy()
+    years_u, year_pos = np.unique(year_keys, return_inverse=True)
+    years_needed = years_u.tolist()
+
+    def by_month(per_year: Dict[int, float]) -> np.ndarray:
+        # Per-year values (in years_needed order) broadcast to months
+        vals = np.array([float(per_year.get(y, 0.0)) for y in years_needed], dtype=np.float64)
+        return vals[year_pos]
 
-    rows = []
-    vals = []
+    def gdp_by_month() -> np.ndarray:
+        # One GDP evaluation per distinct year rather than per month
+        gdp_fn = gdp_model.gdp_fy if cfg.deficits_frame == "FY" else gdp_model.gdp_cy
+        return by_month({y: float(gdp_fn(y)) for y in years_needed})
 
     # Prefer anchor+index if provided
     anchor_year = getattr(cfg, "additional_revenue_anchor_year", None)
@@ -160,156 +177,86 @@ def build_additional_revenue_series(
 
     if anchor_year is not None and anchor_amount is not None and index_kind is not None:
         used_anchor_index = True
-        # Build per-year indexed series in mode units
+        if mode not in {"pct_gdp", "level"}:
+            raise ValueError("additional_revenue.mode must be 'pct_gdp' or 'level'")
+        # Index kind, its inflation map and the anchor as plain scalars, resolved once
+        kind = str(index_kind).lower()
+        pce = getattr(cfg, "inflation_pce", None)
+        cpi = getattr(cfg, "inflation_cpi", None)
+        rate_map = pce if kind == "pce" else cpi if kind == "cpi" else None
+        anchor_y = int(anchor_year)
+        anchor_amt = float(anchor_amount)
+        # Build per-year indexed series in mode units (percent of GDP, or USD millions per year)
+        factors = _compute_cumulative_factors(years_needed, anchor_y, kind, pce, cpi)
+        map_indexed = {
+            y: (anchor_amt * float(factors.get(y, 1.0)) if y >= anchor_y else anchor_amt)
+            for y in years_needed
+        }
+        input_arr = by_month(map_indexed)
         if mode == "pct_gdp":
-            # Percent-of-GDP values per year
-            factors = _compute_cumulative_factors(
-                years_needed,
-                int(anchor_year),
-                str(index_kind),
-                getattr(cfg, "inflation_pce", None),
-                getattr(cfg, "inflation_cpi", None),
-            )
-            pct_map_indexed = {int(y): (float(anchor_amount) * float(factors.get(int(y), 1.0)) if y >= int(anchor_year) else float(anchor_amount)) for y in years_needed}
-            for d in idx:
-                if cfg.deficits_frame == "FY":
-                    y = fiscal_year(d)
-                    gdp = float(gdp_model.gdp_fy(y))
-                else:
-                    y = int(d.year)
-                    gdp = float(gdp_model.gdp_cy(y))
-                pct = float(pct_map_indexed.get(int(y), 0.0))
-                annual = (pct / 100.0) * gdp
-                mval = annual / 12.0
-                vals.append(mval)
-                # For diagnostics, include inflation context
-                rate_map = getattr(cfg, "inflation_pce", None) if str(index_kind).lower() == "pce" else getattr(cfg, "inflation_cpi", None) if str(index_kind).lower() == "cpi" else None
-                rate_pct = 0.0 if int(y) <= int(anchor_year) or rate_map is None else float(rate_map.get(int(y), 0.0))
-                rows.append(
-                    {
-                        "date": d,
-                        "frame": cfg.deficits_frame,
-                        "year_key": int(y),
-                        "mode": mode,
-                        "input_value": pct,
-                        "gdp": gdp,
-                        "additional_revenue_annual_usd_mn": annual,
-                        "additional_revenue_month_usd_mn": mval,
-                        "index": str(index_kind).lower(),
-                        "anchor_year": int(anchor_year),
-                        "anchor_amount": float(anchor_amount),
-                        "inflation_rate_pct": float(rate_pct),
-                        "cumulative_factor": float(factors.get(int(y), 1.0)),
-                    }
-                )
-        elif mode == "level":
-            # USD millions per year
-            factors = _compute_cumulative_factors(
-                years_needed,
-                int(anchor_year),
-                str(index_kind),
-                getattr(cfg, "inflation_pce", None),
-                getattr(cfg, "inflation_cpi", None),
-            )
-            lvl_map_indexed = {int(y): (float(anchor_amount) * float(factors.get(int(y), 1.0)) if y >= int(anchor_year) else float(anchor_amount)) for y in years_needed}
-            for d in idx:
-                if cfg.deficits_frame == "FY":
-                    y = fiscal_year(d)
-                else:
-                    y = int(d.year)
-                annual = float(lvl_map_indexed.get(int(y), 0.0))
-                mval = annual / 12.0
-                vals.append(mval)
-                rate_map = getattr(cfg, "inflation_pce", None) if str(index_kind).lower() == "pce" else getattr(cfg, "inflation_cpi", None) if str(index_kind).lower() == "cpi" else None
-                rate_pct = 0.0 if int(y) <= int(anchor_year) or rate_map is None else float(rate_map.get(int(y), 0.0))
-                rows.append(
-                    {
-                        "date": d,
-                        "frame": cfg.deficits_frame,
-                        "year_key": int(y),
-                        "mode": mode,
-                        "input_value": annual,
-                        "gdp": float("nan"),
-                        "additional_revenue_annual_usd_mn": annual,
-                        "additional_revenue_month_usd_mn": mval,
-                        "index": str(index_kind).lower(),
-                        "anchor_year": int(anchor_year),
-                        "anchor_amount": float(anchor_amount),
-                        "inflation_rate_pct": float(rate_pct),
-                        "cumulative_factor": float(factors.get(int(y), 1.0)),
-                    }
-                )
+            gdp_arr = gdp_by_month()
+            annual_arr = (input_arr / 100.0) * gdp_arr
         else:
-            raise ValueError("additional_revenue.mode must be 'pct_gdp' or 'level'")
-    elif mode == "pct_gdp":
-        pct_map = getattr(cfg, "additional_revenue_annual_pct_gdp", None) or {}
-        pct_filled = _fill_year_map({int(k): float(v) for k, v in pct_map.items()}, years_needed)
-        for d in idx:
-            if cfg.deficits_frame == "FY":
-                y = fiscal_year(d)
-                gdp = float(gdp_model.gdp_fy(y))
-            else:
-                y = int(d.year)
-                gdp = float(gdp_model.gdp_cy(y))
-            pct = float(pct_filled.get(int(y), 0.0))
-            annual = (pct / 100.0) * gdp
-            mval = annual / 12.0
-            vals.append(mval)
-            rows.append(
+            gdp_arr = np.full(len(idx), np.nan)
+            annual_arr = input_arr
+        mval_arr = annual_arr / 12.0
+        # For diagnostics, include inflation context
+        extra_cols = {
+            "index": constant_category(kind, len(idx)),
+            "anchor_year": anchor_y,
+            "anchor_amount": anchor_amt,
+            "inflation_rate_pct": by_month(
                 {
-                    "date": d,
-                    "frame": cfg.deficits_frame,
-                    "year_key": int(y),
-                    "mode": mode,
-                    "input_value": pct,
-                    "gdp": gdp,
-                    "additional_revenue_annual_usd_mn": annual,
-                    "additional_revenue_month_usd_mn": mval,
+                    y: 0.0 if y <= anchor_y or rate_map is None else float(rate_map.get(y, 0.0))
+                    for y in years_needed
                 }
-            )
-    elif mode == "level":
-        lvl_map = getattr(cfg, "additional_revenue_annual_level_usd_millions", None) or {}
-        lvl_filled = _fill_year_map({int(k): float(v) for k, v in lvl_map.items()}, years_needed)
-        for d in idx:
-            if cfg.deficits_frame == "FY":
-                y = fiscal_year(d)
-            else:
-                y = int(d.year)
-            annual = float(lvl_filled.get(int(y), 0.0))
-            mval = annual / 12.0
-            vals.append(mval)
-            rows.append(
-                {
-                    "date": d,
-                    "frame": cfg.deficits_frame,
-                    "year_key": int(y),
-                    "mode": mode,
-                    "input_value": annual,
-                    "gdp": float("nan"),
-                    "additional_revenue_annual_usd_mn": annual,
-                    "additional_revenue_month_usd_mn": mval,
-                }
-            )
+            ),
+            "cumulative_factor": by_month({y: float(factors.get(y, 1.0)) for y in years_needed}),
+        }
+    elif mode in {"pct_gdp", "level"}:
+        if mode == "pct_gdp":
+            pct_map = getattr(cfg, "additional_revenue_annual_pct_gdp", None) or {}
+            input_arr = by_month(fill_year_map(pct_map, years_needed))
+            gdp_arr = gdp_by_month()
+            annual_arr = (input_arr / 100.0) * gdp_arr
+        else:
+            lvl_map = getattr(cfg, "additional_revenue_annual_level_usd_millions", None) or {}
+            input_arr = by_month(fill_year_map(lvl_map, years_needed))
+            gdp_arr = np.full(len(idx), np.nan)
+            annual_arr = input_arr
+        mval_arr = annual_arr / 12.0
+        extra_cols = {}
     else:
         raise ValueError("additional_revenue.mode must be 'pct_gdp' or 'level'")
 
-    series = pd.Series(vals, index=idx, name="additional_revenue")
-    preview = pd.DataFrame(rows)
+    series = pd.Series(mval_arr, index=idx, name="additional_revenue")
+    # Preview assembled column-wise (scalars broadcast to every month)
+    preview = pd.DataFrame(
+        {
+            "date": idx,
+            "frame": constant_category(cfg.deficits_frame, len(idx)),
+            "year_key": year_keys.astype(np.int64),
+            "mode": constant_category(mode, len(idx)),
+            "input_value": input_arr,
+            "gdp": gdp_arr,
+            "additional_revenue_annual_usd_mn": annual_arr,
+            "additional_revenue_month_usd_mn": mval_arr,
+            **extra_cols,
+        }
+    )
     return series, preview
 
 
-def write_additional_revenue_preview(preview: pd.DataFrame, out_path: str | Path) -> Path:
-    p = Path(out_path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    preview.to_csv(p, index=False)
-    return p
+def write_additional_revenue_preview(
+    preview: pd.DataFrame, out_path: str | Path, fmt: str = "csv"
+) -> Path:
+    return write_preview(preview, out_path, fmt)
 
 
-def write_inflation_index_preview(preview: pd.DataFrame, out_path: str | Path) -> Path:
-    p = Path(out_path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    preview.to_csv(p, index=False)
-    return p
+def write_inflation_index_preview(
+    preview: pd.DataFrame, out_path: str | Path, fmt: str = "csv"
+) -> Path:
+    return write_preview(preview, out_path, fmt)
 
 
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import date, datetime
 from pathlib import Path
 from typing import Dict, Literal, Optional, Tuple
@@ -11,11 +11,30 @@ import os
 
 import yaml
 
+try:  # libyaml-backed parser when PyYAML was built with it; same safe semantics
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader
+
 
 FiscalFrame = Literal["FY", "CY"]
 
+# Distinguishes "key absent" from an explicit null in single-lookup .get() checks
+_MISSING = object()
+
+# Bucket keys required by the shares and constant-rates blocks
+_BUCKET_KEYS = ("short", "nb", "tips")
+_BUCKET_KEY_SET = frozenset(_BUCKET_KEYS)
+# Allowed values for frame, additional_revenue.mode and additional_revenue.index
+_FRAMES = frozenset(("FY", "CY"))
+_ADD_REV_MODES = frozenset(("pct_gdp", "level"))
+_INDEX_VALS = frozenset(("none", "pce", "cpi"))
+
+_INF = math.inf
+_NINF = -math.inf
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MacroConfig:
     """Canonical macro configuration used across the project.
 
@@ -77,16 +96,18 @@ class MacroConfig:
     variable_rates_annual: Optional[Dict[str, Dict[int, float]]] = None
 
     def to_normalized_dict(self) -> Dict[str, object]:
-        data = asdict(self)
+        # Shallow field view (no deepcopy); nested maps are shared with the config,
+        # treat as read-only
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
         data["anchor_date"] = self.anchor_date.isoformat()
         data["units"] = {"currency": "USD", "scale": "millions"}
         # Emit inflation block for transparency
         if self.inflation_pce is not None or self.inflation_cpi is not None:
             infl: Dict[str, object] = {}
             if self.inflation_pce is not None:
-                infl["pce"] = {int(k): float(v) for k, v in self.inflation_pce.items()}
+                infl["pce"] = _int_float_map(self.inflation_pce)
             if self.inflation_cpi is not None:
-                infl["cpi"] = {int(k): float(v) for k, v in self.inflation_cpi.items()}
+                infl["cpi"] = _int_float_map(self.inflation_cpi)
             data["inflation"] = infl
         # Name issuance keys for readability
         if self.issuance_default_shares is not None:
@@ -97,44 +118,56 @@ class MacroConfig:
             data["rates_constant"] = {"short": bs, "nb": nb, "tips": tips}
         # Keep FY growth and variable rates as provided (percent), with normalized keys
         if self.gdp_annual_fy_growth_rate is not None:
-            data["gdp_annual_fy_growth_rate"] = {int(k): float(v) for k, v in self.gdp_annual_fy_growth_rate.items()}
+            data["gdp_annual_fy_growth_rate"] = _int_float_map(self.gdp_annual_fy_growth_rate)
         if self.variable_rates_annual is not None:
-            vr: Dict[str, Dict[int, float]] = {}
-            for k, m in self.variable_rates_annual.items():
-                vr[k] = {int(yy): float(val) for yy, val in m.items()}
-            data["variable_rates_annual"] = vr
-        # Nest deficits fields for readability
+            data["variable_rates_annual"] = {
+                k: _int_float_map(m) for k, m in self.variable_rates_annual.items()
+            }
+        # Nest deficits fields for readability (unset entries dropped)
         if self.deficits_frame is not None:
-            deficits_block: Dict[str, object] = {"frame": self.deficits_frame}
-            if self.deficits_annual_pct_gdp is not None:
-                deficits_block["annual_pct_gdp"] = {int(k): float(v) for k, v in self.deficits_annual_pct_gdp.items()}
+            deficits_block = _without_none(
+                {
+                    "frame": self.deficits_frame,
+                    "annual_pct_gdp": _int_float_map(self.deficits_annual_pct_gdp),
+                }
+            )
             # Nest additional_revenue if configured
-            if self.additional_revenue_mode is not None or self.additional_revenue_enabled:
-                add_rev: Dict[str, object] = {"enabled": bool(self.additional_revenue_enabled)}
-                if self.additional_revenue_mode is not None:
-                    add_rev["mode"] = self.additional_revenue_mode
-                if self.additional_revenue_mode == "pct_gdp" and self.additional_revenue_annual_pct_gdp is not None:
-                    add_rev["annual_pct_gdp"] = {int(k): float(v) for k, v in self.additional_revenue_annual_pct_gdp.items()}
-                if self.additional_revenue_mode == "level" and self.additional_revenue_annual_level_usd_millions is not None:
-                    add_rev["annual_level_usd_millions"] = {int(k): float(v) for k, v in self.additional_revenue_annual_level_usd_millions.items()}
-                # Anchor/index fields
-                if self.additional_revenue_anchor_year is not None:
-                    add_rev["anchor_year"] = int(self.additional_revenue_anchor_year)
-                if self.additional_revenue_anchor_amount is not None:
-                    add_rev["anchor_amount"] = float(self.additional_revenue_anchor_amount)
-                if self.additional_revenue_index is not None:
-                    add_rev["index"] = self.additional_revenue_index
-                deficits_block["additional_revenue"] = add_rev
+            mode = self.additional_revenue_mode
+            if mode is not None or self.additional_revenue_enabled:
+                anchor_year = self.additional_revenue_anchor_year
+                anchor_amount = self.additional_revenue_anchor_amount
+                deficits_block["additional_revenue"] = _without_none(
+                    {
+                        "enabled": bool(self.additional_revenue_enabled),
+                        "mode": mode,
+                        "annual_pct_gdp": (
+                            _int_float_map(self.additional_revenue_annual_pct_gdp)
+                            if mode == "pct_gdp"
+                            else None
+                        ),
+                        "annual_level_usd_millions": (
+                            _int_float_map(self.additional_revenue_annual_level_usd_millions)
+                            if mode == "level"
+                            else None
+                        ),
+                        # Anchor/index fields
+                        "anchor_year": int(anchor_year) if anchor_year is not None else None,
+                        "anchor_amount": (
+                            float(anchor_amount) if anchor_amount is not None else None
+                        ),
+                        "index": self.additional_revenue_index,
+                    }
+                )
             data["deficits"] = deficits_block
         # Nest other_interest for readability
-        other_block: Dict[str, object] = {"enabled": self.other_interest_enabled}
-        if self.other_interest_frame is not None:
-            other_block["frame"] = self.other_interest_frame
-        if self.other_interest_annual_pct_gdp is not None:
-            other_block["annual_pct_gdp"] = {int(k): float(v) for k, v in self.other_interest_annual_pct_gdp.items()}
-        if self.other_interest_annual_usd_mn is not None:
-            other_block["annual_usd_mn"] = {int(k): float(v) for k, v in self.other_interest_annual_usd_mn.items()}
-        data["other_interest"] = other_block
+        data["other_interest"] = _without_none(
+            {
+                "enabled": self.other_interest_enabled,
+                "frame": self.other_interest_frame,
+                "annual_pct_gdp": _int_float_map(self.other_interest_annual_pct_gdp),
+                "annual_usd_mn": _int_float_map(self.other_interest_annual_usd_mn),
+            }
+        )
         # Issuance transition block
         data["issuance_shares_transition"] = {
             "enabled": self.issuance_transition_enabled,
@@ -143,6 +176,23 @@ class MacroConfig:
         return data
 
 
+def _without_none(block: Dict[str, object]) -> Dict[str, object]:
+    """Echo block with unset (None) entries left out."""
+    return {k: v for k, v in block.items() if v is not None}
+
+
+def _int_float_map(m: Optional[Dict[object, object]]) -> Optional[Dict[int, float]]:
+    """``{int(k): float(v)}`` view of a year map.
+
+    Already-normalized maps are returned as-is (read-only).
+    """
+    if m is None:
+        return None
+    if all(type(k) is int and type(v) is float for k, v in m.items()):
+        return m  # type: ignore[return-value]
+    return {int(k): float(v) for k, v in m.items()}
+
+
 def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
@@ -159,20 +209,24 @@ def _parse_date(value: object, field_name: str) -> date:
 
 
 def _finite(value: float) -> bool:
-    return not (math.isnan(value) or math.isinf(value))
+    # NaN fails value == value; plain comparisons avoid the math.isnan/isinf calls
+    return value == value and value != _INF and value != _NINF
 
 
 def _validate_shares(shares: Dict[str, object]) -> Tuple[float, float, float]:
-    required = ("short", "nb", "tips")
-    missing = [k for k in required if k not in shares]
-    if missing:
-        raise ValueError(f"issuance_default_shares missing keys: {missing}")
+    if not shares.keys() >= _BUCKET_KEY_SET:
+        raise ValueError(
+            f"issuance_default_shares missing keys: {[k for k in _BUCKET_KEYS if k not in shares]}"
+        )
     short = float(shares["short"])  # type: ignore[arg-type]
     nb = float(shares["nb"])  # type: ignore[arg-type]
     tips = float(shares["tips"])  # type: ignore[arg-type]
-    for name, v in ("short", short), ("nb", nb), ("tips", tips):
-        if not (0.0 <= v <= 1.0):
-            raise ValueError(f"share {name} out of bounds [0,1]: {v}")
+    if not (0.0 <= short <= 1.0):
+        raise ValueError(f"share short out of bounds [0,1]: {short}")
+    if not (0.0 <= nb <= 1.0):
+        raise ValueError(f"share nb out of bounds [0,1]: {nb}")
+    if not (0.0 <= tips <= 1.0):
+        raise ValueError(f"share tips out of bounds [0,1]: {tips}")
     total = short + nb + tips
     if abs(total - 1.0) > 1e-6:
         raise ValueError(f"shares must sum to 1.0 (±1e-6), got {total}")
@@ -180,22 +234,41 @@ def _validate_shares(shares: Dict[str, object]) -> Tuple[float, float, float]:
 
 
 def _validate_rates_constant(values: Dict[str, object]) -> Tuple[float, float, float]:
-    required = ("short", "nb", "tips")
-    missing = [k for k in required if k not in values]
-    if missing:
-        raise ValueError(f"rates_constant missing keys: {missing}")
+    if not values.keys() >= _BUCKET_KEY_SET:
+        raise ValueError(
+            f"rates_constant missing keys: {[k for k in _BUCKET_KEYS if k not in values]}"
+        )
     short = float(values["short"])  # type: ignore[arg-type]
     nb = float(values["nb"])  # type: ignore[arg-type]
     tips = float(values["tips"])  # type: ignore[arg-type]
-    for name, v in ("short", short), ("nb", nb), ("tips", tips):
-        if not _finite(v):
-            raise ValueError(f"rate {name} not finite: {v}")
+    if not _finite(short):
+        raise ValueError(f"rate short not finite: {short}")
+    if not _finite(nb):
+        raise ValueError(f"rate nb not finite: {nb}")
+    if not _finite(tips):
+        raise ValueError(f"rate tips not finite: {tips}")
     return short, nb, tips
 
 
 def _validate_fy_growth_map(values: Dict[object, object], *, field: str) -> Dict[int, float]:
     if not isinstance(values, dict):
         raise ValueError(f"{field} must be a mapping of FY->percent")
+    # YAML usually yields int years and float values already: one check pass, no rebuild
+    if all(type(k) is int and type(v) is float and _finite(v) for k, v in values.items()):
+        return values  # type: ignore[return-value]
+    # Convert in one comprehension; only a failed conversion takes the per-key loop, which
+    # raises the same error (for the same key) as before
+    try:
+        pairs = [(int(k), float(v)) for k, v in values.items()]  # type: ignore[arg-type]
+    except Exception:  # noqa: BLE001
+        return _validate_fy_growth_map_slow(values, field=field)
+    for year, val in pairs:
+        if val != val or val == _INF or val == _NINF:
+            raise ValueError(f"{field}[{year}] must be finite, got {val}")
+    return dict(pairs)
+
+
+def _validate_fy_growth_map_slow(values: Dict[object, object], *, field: str) -> Dict[int, float]:
     out: Dict[int, float] = {}
     for k, v in values.items():
         try:
@@ -212,28 +285,61 @@ def _validate_fy_growth_map(values: Dict[object, object], *, field: str) -> Dict
 def _validate_variable_rates_annual(values: Dict[str, object]) -> Dict[str, Dict[int, float]]:
     if not isinstance(values, dict):
         raise ValueError("variable_rates_annual must be a mapping of bucket->{FY->percent}")
+    if not values:
+        return {}
+    # Common case: canonical lowercase bucket names over FY maps; no per-key normalization
+    if all(k in _BUCKET_KEY_SET and isinstance(m, dict) for k, m in values.items()):
+        return {
+            k: _validate_fy_growth_map(m, field=f"variable_rates_annual[{k}]")
+            for k, m in values.items()
+        }
     out: Dict[str, Dict[int, float]] = {}
     for bucket, mapping in values.items():
         if not isinstance(mapping, dict):
             raise ValueError(f"variable_rates_annual[{bucket!r}] must be a mapping of FY->percent")
         key = str(bucket).lower()
-        if key not in {"short", "nb", "tips"}:
+        if key not in _BUCKET_KEY_SET:
             # Allow forward-compat; accept unknown keys but keep normalized
             key = key
         out[key] = _validate_fy_growth_map(mapping, field=f"variable_rates_annual[{key}]")
     return out
 
 
+# Parsed configs keyed by (resolved path, mtime_ns, size); an edited file gets a new key
+_CONFIG_CACHE: Dict[Tuple[str, int, int], MacroConfig] = {}
+
+
+def clear_config_cache() -> None:
+    """Drop all memoized configs (tests that rewrite a YAML in place within one mtime tick)."""
+    _CONFIG_CACHE.clear()
+
+
 def load_macro_yaml(path: os.PathLike[str] | str) -> MacroConfig:
     """Load and validate macro configuration from YAML.
 
-    Returns a MacroConfig with canonicalized fields and units assumptions.
+    Returns a MacroConfig with canonicalized fields and units assumptions. Repeated loads of an
+    unchanged file return the same (frozen, read-only) instance.
     """
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(f"Config YAML not found: {p}")
-    with p.open("r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+    st = p.stat()
+    resolved = str(p.resolve())
+    key = (resolved, st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        return cached
+    cfg = _parse_macro_yaml(p)
+    # Keep only the newest entry per file
+    for stale in [k for k in _CONFIG_CACHE if k[0] == resolved]:
+        del _CONFIG_CACHE[stale]
+    _CONFIG_CACHE[key] = cfg
+    return cfg
+
+
+def _parse_macro_yaml(p: Path) -> MacroConfig:
+    # Raw bytes straight to the loader; libyaml detects and decodes UTF-8 itself
+    raw = yaml.load(p.read_bytes(), Loader=_YamlLoader) or {}
 
     if not isinstance(raw, dict):
         raise ValueError("Top-level YAML must be a mapping/dict")
@@ -256,22 +362,25 @@ def load_macro_yaml(path: os.PathLike[str] | str) -> MacroConfig:
         raise ValueError("gdp.anchor_value_usd_millions must be positive and finite")
 
     gdp_annual_fy_growth_rate: Optional[Dict[int, float]] = None
-    if isinstance(gdp.get("annual_fy_growth_rate"), dict):
+    growth = gdp.get("annual_fy_growth_rate")
+    if isinstance(growth, dict):
         gdp_annual_fy_growth_rate = _validate_fy_growth_map(
-            gdp["annual_fy_growth_rate"], field="gdp.annual_fy_growth_rate"  # type: ignore[index]
+            growth, field="gdp.annual_fy_growth_rate"
         )
 
     deficits = raw.get("deficits")
-    if not isinstance(deficits, dict) or "frame" not in deficits:
+    frame_raw = deficits.get("frame", _MISSING) if isinstance(deficits, dict) else _MISSING
+    if frame_raw is _MISSING:
         raise ValueError("deficits.frame must be provided and be 'FY' or 'CY'")
-    frame = str(deficits["frame"]).upper()
-    if frame not in {"FY", "CY"}:
+    frame = str(frame_raw).upper()
+    if frame not in _FRAMES:
         raise ValueError("deficits.frame must be 'FY' or 'CY'")
 
     deficits_annual_pct_gdp: Optional[Dict[int, float]] = None
-    if isinstance(deficits.get("annual_pct_gdp"), dict):
+    def_pct = deficits.get("annual_pct_gdp")
+    if isinstance(def_pct, dict):
         # Percent values; keep as provided (finite), keyed by year in given frame
-        deficits_annual_pct_gdp = _validate_fy_growth_map(deficits["annual_pct_gdp"], field="deficits.annual_pct_gdp")
+        deficits_annual_pct_gdp = _validate_fy_growth_map(def_pct, field="deficits.annual_pct_gdp")
 
     # Additional revenue parsing (optional)
     additional_revenue_mode: Optional[Literal["pct_gdp", "level"]] = None
@@ -282,39 +391,49 @@ def load_macro_yaml(path: os.PathLike[str] | str) -> MacroConfig:
     additional_revenue_anchor_year: Optional[int] = None
     additional_revenue_anchor_amount: Optional[float] = None
     additional_revenue_index: Optional[Literal["none", "pce", "cpi"]] = None
-    add_rev = deficits.get("additional_revenue") if isinstance(deficits, dict) else None
+    add_rev = deficits.get("additional_revenue")
     if isinstance(add_rev, dict):
-        if "enabled" in add_rev:
+        enabled = add_rev.get("enabled", _MISSING)
+        if enabled is not _MISSING:
             try:
-                additional_revenue_enabled = bool(add_rev.get("enabled", False))
+                additional_revenue_enabled = bool(enabled)
             except Exception:  # noqa: BLE001
                 additional_revenue_enabled = False
         mode_str = str(add_rev.get("mode", "")).strip().lower()
-        if mode_str in {"pct_gdp", "level"}:
+        if mode_str in _ADD_REV_MODES:
             additional_revenue_mode = mode_str  # type: ignore[assignment]
         elif mode_str:
             raise ValueError("deficits.additional_revenue.mode must be 'pct_gdp' or 'level'")
         # Validate maps
-        if isinstance(add_rev.get("annual_pct_gdp"), dict):
-            additional_revenue_annual_pct_gdp = _validate_fy_growth_map(add_rev["annual_pct_gdp"], field="deficits.additional_revenue.annual_pct_gdp")
-        if isinstance(add_rev.get("annual_level_usd_millions"), dict):
-            additional_revenue_annual_level_usd_millions = _validate_fy_growth_map(add_rev["annual_level_usd_millions"], field="deficits.additional_revenue.annual_level_usd_millions")
+        add_pct = add_rev.get("annual_pct_gdp")
+        if isinstance(add_pct, dict):
+            additional_revenue_annual_pct_gdp = _validate_fy_growth_map(
+                add_pct, field="deficits.additional_revenue.annual_pct_gdp"
+            )
+        add_lvl = add_rev.get("annual_level_usd_millions")
+        if isinstance(add_lvl, dict):
+            additional_revenue_annual_level_usd_millions = _validate_fy_growth_map(
+                add_lvl, field="deficits.additional_revenue.annual_level_usd_millions"
+            )
         # Anchor/index (optional)
-        if "anchor_year" in add_rev:
+        anchor_year = add_rev.get("anchor_year", _MISSING)
+        if anchor_year is not _MISSING:
             try:
-                additional_revenue_anchor_year = int(add_rev.get("anchor_year"))
+                additional_revenue_anchor_year = int(anchor_year)
             except Exception as exc:  # noqa: BLE001
                 raise ValueError("deficits.additional_revenue.anchor_year must be an integer") from exc
-        if "anchor_amount" in add_rev:
+        anchor_amount = add_rev.get("anchor_amount", _MISSING)
+        if anchor_amount is not _MISSING:
             try:
-                additional_revenue_anchor_amount = float(add_rev.get("anchor_amount"))
+                additional_revenue_anchor_amount = float(anchor_amount)
             except Exception as exc:  # noqa: BLE001
                 raise ValueError("deficits.additional_revenue.anchor_amount must be a number") from exc
             if not _finite(additional_revenue_anchor_amount):
                 raise ValueError("deficits.additional_revenue.anchor_amount must be finite")
-        if "index" in add_rev:
-            idx_val = str(add_rev.get("index", "")).strip().lower()
-            if idx_val in {"none", "pce", "cpi"}:
+        index_raw = add_rev.get("index", _MISSING)
+        if index_raw is not _MISSING:
+            idx_val = str(index_raw).strip().lower()
+            if idx_val in _INDEX_VALS:
                 additional_revenue_index = idx_val  # type: ignore[assignment]
             elif idx_val:
                 raise ValueError("deficits.additional_revenue.index must be one of: none, PCE, CPI")
@@ -343,8 +462,9 @@ def load_macro_yaml(path: os.PathLike[str] | str) -> MacroConfig:
 
     # Optional validations
     issuance_default_shares: Optional[Tuple[float, float, float]] = None
-    if isinstance(raw.get("issuance_default_shares"), dict):
-        issuance_default_shares = _validate_shares(raw["issuance_default_shares"])  # type: ignore[index]
+    shares = raw.get("issuance_default_shares")
+    if isinstance(shares, dict):
+        issuance_default_shares = _validate_shares(shares)
 
     rates_constant: Optional[Tuple[float, float, float]] = None
     rates = raw.get("rates")
@@ -356,8 +476,9 @@ def load_macro_yaml(path: os.PathLike[str] | str) -> MacroConfig:
 
     # Optional FY-based variable rates (percent)
     variable_rates_annual: Optional[Dict[str, Dict[int, float]]] = None
-    if isinstance(raw.get("variable_rates_annual"), dict):
-        variable_rates_annual = _validate_variable_rates_annual(raw["variable_rates_annual"])  # type: ignore[index]
+    var_rates = raw.get("variable_rates_annual")
+    if isinstance(var_rates, dict):
+        variable_rates_annual = _validate_variable_rates_annual(var_rates)
 
     # Other interest (optional block); default enabled when absent
     other_interest_enabled: bool = True
@@ -367,40 +488,52 @@ def load_macro_yaml(path: os.PathLike[str] | str) -> MacroConfig:
 
     other = raw.get("other_interest")
     if isinstance(other, dict):
-        if "enabled" in other:
-            other_interest_enabled = bool(other.get("enabled", True))
-        if "frame" in other:
-            fr = str(other.get("frame", "")).upper()
-            if fr in {"FY", "CY"}:
+        enabled = other.get("enabled", _MISSING)
+        if enabled is not _MISSING:
+            other_interest_enabled = bool(enabled)
+        fr_raw = other.get("frame", _MISSING)
+        if fr_raw is not _MISSING:
+            fr = str(fr_raw).upper()
+            if fr in _FRAMES:
                 other_interest_frame = fr  # type: ignore[assignment]
-        if isinstance(other.get("annual_pct_gdp"), dict):
-            other_interest_annual_pct_gdp = _validate_fy_growth_map(other["annual_pct_gdp"], field="other_interest.annual_pct_gdp")
-        if isinstance(other.get("annual_usd_mn"), dict):
+        oth_pct = other.get("annual_pct_gdp")
+        if isinstance(oth_pct, dict):
+            other_interest_annual_pct_gdp = _validate_fy_growth_map(
+                oth_pct, field="other_interest.annual_pct_gdp"
+            )
+        oth_usd = other.get("annual_usd_mn")
+        if isinstance(oth_usd, dict):
             # USD millions directly; validate finite via growth map helper reuse
-            other_interest_annual_usd_mn = _validate_fy_growth_map(other["annual_usd_mn"], field="other_interest.annual_usd_mn")
+            other_interest_annual_usd_mn = _validate_fy_growth_map(
+                oth_usd, field="other_interest.annual_usd_mn"
+            )
 
     # Issuance transition (optional); default enabled
     issuance_transition_enabled = True
     issuance_transition_months = 6
     trans = raw.get("issuance_shares_transition")
     if isinstance(trans, dict):
-        if "enabled" in trans:
-            issuance_transition_enabled = bool(trans.get("enabled", True))
-        if "months" in trans:
+        enabled = trans.get("enabled", _MISSING)
+        if enabled is not _MISSING:
+            issuance_transition_enabled = bool(enabled)
+        months = trans.get("months", _MISSING)
+        if months is not _MISSING:
             try:
-                issuance_transition_months = max(1, int(trans.get("months", 6)))
+                issuance_transition_months = max(1, int(months))
             except Exception:  # noqa: BLE001
                 issuance_transition_months = 6
 
     # Inflation block (optional, top-level)
     inflation_pce: Optional[Dict[int, float]] = None
     inflation_cpi: Optional[Dict[int, float]] = None
-    if isinstance(raw.get("inflation"), dict):
-        infl = raw.get("inflation")
-        if isinstance(infl.get("pce"), dict):
-            inflation_pce = _validate_fy_growth_map(infl["pce"], field="inflation.pce")  # type: ignore[index]
-        if isinstance(infl.get("cpi"), dict):
-            inflation_cpi = _validate_fy_growth_map(infl["cpi"], field="inflation.cpi")  # type: ignore[index]
+    infl = raw.get("inflation")
+    if isinstance(infl, dict):
+        pce = infl.get("pce")
+        if isinstance(pce, dict):
+            inflation_pce = _validate_fy_growth_map(pce, field="inflation.pce")
+        cpi = infl.get("cpi")
+        if isinstance(cpi, dict):
+            inflation_cpi = _validate_fy_growth_map(cpi, field="inflation.cpi")
 
     return MacroConfig(
         anchor_date=anchor_date,
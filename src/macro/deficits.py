@@ -1,26 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
-from core.dates import fiscal_year
+from core.dates import fiscal_year_series
+from core.io_utils import write_preview
 from macro.config import MacroConfig
 from macro.gdp import GDPModel
-
-
-def _fill_year_map(values: Dict[int, float], years_needed: list[int]) -> Dict[int, float]:
-    if not values:
-        return {y: 0.0 for y in years_needed}
-    filled: Dict[int, float] = {}
-    sorted_years = sorted(set([*years_needed, *values.keys()]))
-    current = values.get(min(values.keys()), 0.0)
-    for y in sorted_years:
-        if y in values:
-            current = float(values[y])
-        filled[y] = current
-    return {y: filled[y] for y in years_needed}
+from macro.series_utils import constant_category, fill_year_map
 
 
 def build_primary_deficit_series(
@@ -38,49 +28,40 @@ def build_primary_deficit_series(
     idx = pd.to_datetime(pd.DatetimeIndex(index)).to_period("M").to_timestamp()
 
     pct_map = cfg.deficits_annual_pct_gdp or {}
-    # Determine coverage years needed for frame
+    # Year key per month for the frame; coverage and per-year values come from its distinct years
     if cfg.deficits_frame == "FY":
-        years_needed = sorted(set([fiscal_year(d) for d in idx]))
+        year_keys = fiscal_year_series(idx).to_numpy()
     else:
-        years_needed = sorted(set([d.year for d in idx]))
-    pct_filled = _fill_year_map({int(k): float(v) for k, v in pct_map.items()}, years_needed)
+        year_keys = idx.year.to_numpy()
+    years_u, year_pos = np.unique(year_keys, return_inverse=True)
+    years_needed = years_u.tolist()
+    pct_filled = fill_year_map(pct_map, years_needed)
 
-    # Build per-month values
-    rows = []
-    vals = []
-    for d in idx:
-        if cfg.deficits_frame == "FY":
-            y = fiscal_year(d)
-            gdp = float(gdp_model.gdp_fy(y))
-        else:
-            y = int(d.year)
-            gdp = float(gdp_model.gdp_cy(y))
-        pct = float(pct_filled.get(int(y), 0.0))
-        pct_decimal = pct / 100.0
-        annual = pct_decimal * gdp
-        mval = annual / 12.0
-        vals.append(mval)
-        rows.append(
-            {
-                "date": d,
-                "frame": cfg.deficits_frame,
-                "year_key": int(y),
-                "pct_gdp": pct,
-                "gdp": gdp,
-                "deficit_annual_usd_mn": annual,
-                "deficit_month_usd_mn": mval,
-            }
-        )
+    # Per-year inputs (one GDP evaluation per year) broadcast to months
+    gdp_fn = gdp_model.gdp_fy if cfg.deficits_frame == "FY" else gdp_model.gdp_cy
+    gdp = np.array([float(gdp_fn(y)) for y in years_needed], dtype=np.float64)[year_pos]
+    pct = np.array([float(pct_filled.get(y, 0.0)) for y in years_needed], dtype=np.float64)[
+        year_pos
+    ]
+    annual = (pct / 100.0) * gdp
+    mval = annual / 12.0
 
-    series = pd.Series(vals, index=idx, name="primary_deficit")
-    preview = pd.DataFrame(rows)
+    series = pd.Series(mval, index=idx, name="primary_deficit")
+    preview = pd.DataFrame(
+        {
+            "date": idx,
+            "frame": constant_category(cfg.deficits_frame, len(idx)),
+            "year_key": year_keys.astype(np.int64),
+            "pct_gdp": pct,
+            "gdp": gdp,
+            "deficit_annual_usd_mn": annual,
+            "deficit_month_usd_mn": mval,
+        }
+    )
     return series, preview
 
 
-def write_deficits_preview(preview: pd.DataFrame, out_path: str | Path) -> Path:
-    p = Path(out_path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    preview.to_csv(p, index=False)
-    return p
+def write_deficits_preview(preview: pd.DataFrame, out_path: str | Path, fmt: str = "csv") -> Path:
+    return write_preview(preview, out_path, fmt)
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Iterable, Optional
 
+import numpy as np
 import pandas as pd
 
 from core.dates import fiscal_year
@@ -21,6 +22,18 @@ class GDPModel:
     growth_fy: Dict[int, float]
 
     def gdp_fy(self, year: int) -> float:
+        # Levels memoized per instance (monthly builders ask for the same FY repeatedly);
+        # missing-growth KeyErrors are not cached and re-raise on every call
+        cache = self.__dict__.get("_fy_levels")
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, "_fy_levels", cache)
+        level = cache.get(year)
+        if level is None:
+            level = cache[year] = self._gdp_fy_uncached(year)
+        return level
+
+    def _gdp_fy_uncached(self, year: int) -> float:
         if year == self.anchor_fy:
             return float(self.anchor_value_usd_millions)
         level = float(self.anchor_value_usd_millions)
@@ -45,6 +58,28 @@ class GDPModel:
         """
         return 0.75 * self.gdp_fy(year) + 0.25 * self.gdp_fy(year + 1)
 
+    def gdp_fy_array(self, years: Iterable[int]) -> np.ndarray:
+        """Vectorized ``gdp_fy``: NaN where the compounding path lacks a growth rate."""
+        yrs = np.asarray(years if isinstance(years, np.ndarray) else list(years), dtype=np.int64)
+        if yrs.size == 0:
+            return np.empty(0, dtype=float)
+        lo = min(int(yrs.min()), self.anchor_fy)
+        hi = max(int(yrs.max()), self.anchor_fy)
+        nan = float("nan")
+        anchor = float(self.anchor_value_usd_millions)
+        # Same sequential multiply/divide order as gdp_fy, so levels match it exactly
+        fwd = [1.0 + float(self.growth_fy.get(y, nan)) for y in range(self.anchor_fy + 1, hi + 1)]
+        back = [1.0 + float(self.growth_fy.get(y, nan)) for y in range(self.anchor_fy, lo, -1)]
+        up = np.multiply.accumulate(np.array([anchor, *fwd]))  # FY anchor..hi
+        down = np.divide.accumulate(np.array([anchor, *back]))  # FY anchor..lo
+        levels = np.concatenate([down[:0:-1], up])  # FY lo..hi
+        return levels[yrs - lo]
+
+    def gdp_cy_array(self, years: Iterable[int]) -> np.ndarray:
+        """Vectorized ``gdp_cy`` (NaN where either FY level is unavailable)."""
+        yrs = np.asarray(years if isinstance(years, np.ndarray) else list(years), dtype=np.int64)
+        return 0.75 * self.gdp_fy_array(yrs) + 0.25 * self.gdp_fy_array(yrs + 1)
+
 
 def build_gdp_function(anchor_date, anchor_gdp: float, growth_fy: Dict[int, float]) -> GDPModel:
     anchor_fy = fiscal_year(pd.Timestamp(anchor_date))
@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Iterable, List, Mapping, Tuple
 
 import math
+import numpy as np
 import pandas as pd
 
 
@@ -44,13 +45,10 @@ class FixedSharesPolicy:
 
     def get(self, index: Iterable[pd.Timestamp]) -> pd.DataFrame:
         idx = pd.to_datetime(pd.DatetimeIndex(index)).to_period("M").to_timestamp()
+        # One contiguous (n, 3) float64 block instead of three boxed Python lists
+        row = np.array([self.short, self.nb, self.tips], dtype=np.float64)
         df = pd.DataFrame(
-            {
-                "short": [self.short] * len(idx),
-                "nb": [self.nb] * len(idx),
-                "tips": [self.tips] * len(idx),
-            },
-            index=idx,
+            np.broadcast_to(row, (len(idx), 3)).copy(), columns=["short", "nb", "tips"], index=idx
         )
         df.index.name = "date"
         return df
@@ -76,25 +74,20 @@ class PiecewiseSharesPolicy:
         # sort and dedupe by start
         norm_segments.sort(key=lambda x: x[0])
         self._segments = norm_segments
+        # Sorted start dates and an (S, 3) share table for binary search in get()
+        self._starts = np.array(
+            [s.to_datetime64() for s, _ in norm_segments], dtype="datetime64[ns]"
+        )
+        self._vals = np.array([v for _, v in norm_segments], dtype=np.float64).reshape(-1, 3)
 
     def get(self, index: Iterable[pd.Timestamp]) -> pd.DataFrame:
         idx = pd.to_datetime(pd.DatetimeIndex(index)).to_period("M").to_timestamp()
-        # For each date, pick last segment whose start <= date
-        starts = [s for s, _ in self._segments]
-        values = [v for _, v in self._segments]
-        out = []
-        for d in idx:
-            pick = None
-            for s, v in zip(starts, values):
-                if s <= d:
-                    pick = v
-                else:
-                    break
-            if pick is None:
-                # Before first segment: use first
-                pick = values[0]
-            out.append(pick)
-        df = pd.DataFrame(out, columns=["short", "nb", "tips"], index=idx)
+        # For each date, pick last segment whose start <= date;
+        # before the first segment, use the first
+        pos = np.searchsorted(self._starts, idx.to_numpy(dtype="datetime64[ns]"), side="right") - 1
+        df = pd.DataFrame(
+            self._vals[np.maximum(pos, 0)], columns=["short", "nb", "tips"], index=idx
+        )
         df.index.name = "date"
         return df
 
@@ -1,26 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
-from core.dates import fiscal_year
+from core.dates import fiscal_year_series
+from core.io_utils import write_preview
 from macro.config import MacroConfig
 from macro.gdp import GDPModel
-
-
-def _fill_year_map(values: Dict[int, float], years_needed: list[int]) -> Dict[int, float]:
-    if not values:
-        return {y: 0.0 for y in years_needed}
-    filled: Dict[int, float] = {}
-    sorted_years = sorted(set([*years_needed, *values.keys()]))
-    current = values.get(min(values.keys()), 0.0)
-    for y in sorted_years:
-        if y in values:
-            current = float(values[y])
-        filled[y] = current
-    return {y: filled[y] for y in years_needed}
+from macro.series_utils import constant_category, fill_year_map
 
 
 def build_other_interest_series(
@@ -46,61 +36,51 @@ def build_other_interest_series(
     pct_map = cfg.other_interest_annual_pct_gdp or {}
     abs_map = cfg.other_interest_annual_usd_mn or {}
 
-    # Determine coverage years needed for frame
+    # Year key per month for the frame; coverage and per-year values come from its distinct years
     if frame == "FY":
-        years_needed = sorted(set([fiscal_year(d) for d in idx]))
+        year_keys = fiscal_year_series(idx).to_numpy()
     else:
-        years_needed = sorted(set([d.year for d in idx]))
+        year_keys = idx.year.to_numpy()
+
+    years_u, year_pos = np.unique(year_keys, return_inverse=True)
+    years_needed = years_u.tolist()
 
-    pct_filled = _fill_year_map({int(k): float(v) for k, v in pct_map.items()}, years_needed)
-    abs_filled = _fill_year_map({int(k): float(v) for k, v in abs_map.items()}, years_needed)
+    pct_filled = fill_year_map(pct_map, years_needed)
+    abs_filled = fill_year_map(abs_map, years_needed)
     abs_keys = set(int(k) for k in abs_map.keys())
 
-    rows = []
-    vals = []
-    for d in idx:
-        if frame == "FY":
-            y = fiscal_year(d)
-            gdp = float(gdp_model.gdp_fy(y))
-        else:
-            y = int(d.year)
-            gdp = float(gdp_model.gdp_cy(y))
-
-        # Compute annual USD: prefer absolute if provided for that year; else use pct-of-GDP
-        abs_usd = float(abs_filled.get(int(y), 0.0))
-        # Prefer ABS only if explicitly provided for the year
-        if int(y) in abs_keys:
-            annual = abs_usd
-            mode = "ABS"
-            pct_val = float(pct_filled.get(int(y), 0.0))
-        else:
-            pct_val = float(pct_filled.get(int(y), 0.0))
-            annual = (pct_val / 100.0) * gdp
-            mode = "PCT"
-
-        mval = annual / 12.0
-        vals.append(mval)
-        rows.append(
-            {
-                "date": d,
-                "frame": frame,
-                "year_key": int(y),
-                "mode": mode,
-                "pct_gdp": pct_val,
-                "annual_usd_mn": annual,
-                "monthly_usd_mn": mval,
-            }
-        )
-
-    series = pd.Series(vals, index=idx, name="other_interest")
-    preview = pd.DataFrame(rows)
+    # Per-year inputs (one GDP evaluation per year) broadcast to months
+    gdp_fn = gdp_model.gdp_fy if frame == "FY" else gdp_model.gdp_cy
+    gdp = np.array([float(gdp_fn(y)) for y in years_needed], dtype=np.float64)[year_pos]
+    pct_val = np.array([float(pct_filled.get(y, 0.0)) for y in years_needed], dtype=np.float64)[
+        year_pos
+    ]
+    abs_usd = np.array([float(abs_filled.get(y, 0.0)) for y in years_needed], dtype=np.float64)[
+        year_pos
+    ]
+    # Prefer ABS only if explicitly provided for the year; else use pct-of-GDP
+    is_abs = np.array([y in abs_keys for y in years_needed], dtype=bool)[year_pos]
+    annual = np.where(is_abs, abs_usd, (pct_val / 100.0) * gdp)
+    mval = annual / 12.0
+
+    series = pd.Series(mval, index=idx, name="other_interest")
+    preview = pd.DataFrame(
+        {
+            "date": idx,
+            "frame": constant_category(frame, len(idx)),
+            "year_key": year_keys.astype(np.int64),
+            "mode": pd.Categorical.from_codes(is_abs.astype(np.int8), categories=["PCT", "ABS"]),
+            "pct_gdp": pct_val,
+            "annual_usd_mn": annual,
+            "monthly_usd_mn": mval,
+        }
+    )
     return series, preview
 
 
-def write_other_interest_preview(preview: pd.DataFrame, out_path: str | Path) -> Path:
-    p = Path(out_path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    preview.to_csv(p, index=False)
-    return p
+def write_other_interest_preview(
+    preview: pd.DataFrame, out_path: str | Path, fmt: str = "csv"
+) -> Path:
+    return write_preview(preview, out_path, fmt)
 
 
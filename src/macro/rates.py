@@ -8,7 +8,7 @@ import math
 import numpy as np
 import pandas as pd
 
-from core.dates import fiscal_year
+from core.dates import fiscal_year_series
 
 REQUIRED_RATE_COLS: Tuple[str, str, str] = ("short", "nb", "tips")
 
@@ -120,16 +120,21 @@ class FiscalYearVariableRatesProvider:
 
     def get(self, index: Iterable[pd.Timestamp]) -> pd.DataFrame:
         idx = pd.to_datetime(pd.DatetimeIndex(index)).to_period("M").to_timestamp()
-        fy_index = pd.Index([fiscal_year(ts) for ts in idx], name="fy")
+        fy_index = fiscal_year_series(idx).to_numpy(dtype=np.int64)
+        # Resolve each distinct FY once (in order of first appearance, so errors name the same
+        # month/bucket as a month-by-month walk would), then fill pre-sized columns by position
+        fy_u, first, inverse = np.unique(fy_index, return_index=True, return_inverse=True)
 
         buckets = list(REQUIRED_RATE_COLS)
-        data = {b: [] for b in buckets}
-        for fy in fy_index:
+        per_fy = {b: np.empty(len(fy_u), dtype=np.float64) for b in buckets}
+        known = {b: sorted(self.mapping.get(b, {})) for b in buckets}
+        for k in np.argsort(first, kind="stable").tolist():
+            fy = int(fy_u[k])
             for b in buckets:
                 series = self.mapping.get(b, {})
                 if not series:
                     raise ValueError(f"No variable rates provided for bucket '{b}'")
-                years = sorted(series)
+                years = known[b]
                 if fy in series:
                     val = float(series[fy])
                 elif fy < years[0]:
@@ -139,7 +144,8 @@ class FiscalYearVariableRatesProvider:
                     val = float(series[years[-1]])
                 if not math.isfinite(val):
                     raise ValueError(f"Non-finite rate for {b} FY{fy}: {val}")
-                data[b].append(val)
+                per_fy[b][k] = val
+        data = {b: per_fy[b][inverse] for b in buckets}
 
         df = pd.DataFrame(data, index=idx)
         _assert_required_columns(df)
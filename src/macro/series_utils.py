@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def fill_year_map(values: Mapping[object, object], years_needed: list[int]) -> Dict[int, float]:
+    """Value per needed year: last provided year at or before it, else the earliest provided value.
+
+    Keys and values are coerced with int()/float() here, so callers can pass config maps as-is.
+    """
+    if not values:
+        return {y: 0.0 for y in years_needed}
+    if values.keys() >= set(years_needed):
+        # Every needed year is listed explicitly: no carry needed
+        return {y: float(values[y]) for y in years_needed}
+    n = len(values)
+    known = np.fromiter((int(k) for k in values.keys()), dtype=np.int64, count=n)
+    order = np.argsort(known, kind="stable")
+    known = known[order]
+    vals = np.fromiter((float(v) for v in values.values()), dtype=np.float64, count=n)[order]
+    pos = np.searchsorted(known, np.asarray(years_needed, dtype=np.int64), side="right") - 1
+    return dict(zip(years_needed, vals[np.maximum(pos, 0)].tolist()))
+
+
+def constant_category(value: Optional[str], n: int) -> pd.Categorical:
+    """A length-n categorical holding one label (int8 codes instead of n string pointers)."""
+    if value is None:
+        return pd.Categorical.from_codes(np.full(n, -1, dtype=np.int8), categories=[])
+    return pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[value])
@@ -117,3 +117,16 @@ rates:
     # Columns extended
     for col in ["index", "anchor_year", "anchor_amount", "inflation_rate_pct", "cumulative_factor"]:
         assert col in df.columns
+
+
+def test_cumulative_factors_memoized_per_inputs() -> None:
+    from macro.additional_revenue import _compute_cumulative_factors, _cumulative_factors_cached
+
+    _cumulative_factors_cached.cache_clear()
+    pce = {2026: 2.0, 2027: 3.0}
+    first = _compute_cumulative_factors([2025, 2026, 2027, 2028], 2025, "PCE", pce, None)
+    assert first == {2025: 1.0, 2026: 1.02, 2027: 1.02 * 1.03, 2028: 1.02 * 1.03 * 1.03}
+    first[2026] = 0.0  # callers get their own dict
+    again = _compute_cumulative_factors([2025, 2026, 2027, 2028], 2025, "pce", dict(pce), None)
+    assert again[2026] == 1.02
+    assert _cumulative_factors_cached.cache_info().hits == 1
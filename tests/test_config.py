@@ -3,10 +3,11 @@ from __future__ import annotations
 from pathlib import Path
 import json
 import math
+import os
 
 import pytest
 
-from macro.config import load_macro_yaml, write_config_echo
+from macro.config import clear_config_cache, load_macro_yaml, write_config_echo
 
 
 def write_yaml(path: Path, content: str) -> None:
@@ -174,4 +175,35 @@ variable_rates_annual:
         load_macro_yaml(cfg_path)
 
 
+def test_load_macro_yaml_memoized_until_file_changes(tmp_path: Path) -> None:
+    body = """
+anchor_date: 2025-07-01
+horizon_months: {h}
+gdp:
+  anchor_fy: 2025
+  anchor_value_usd_millions: 30000000
+deficits:
+  frame: FY
+issuance_default_shares:
+  short: 0.2
+  nb: 0.7
+  tips: 0.1
+rates:
+  type: constant
+  values:
+    short: 0.03
+    nb: 0.04
+    tips: 0.02
+"""
+    cfg_path = tmp_path / "macro.yaml"
+    write_yaml(cfg_path, body.format(h=24))
+    first = load_macro_yaml(cfg_path)
+    assert load_macro_yaml(str(cfg_path)) is first
+
+    write_yaml(cfg_path, body.format(h=36))
+    st = cfg_path.stat()
+    os.utime(cfg_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_macro_yaml(cfg_path).horizon_months == 36
 
+    clear_config_cache()
+    assert load_macro_yaml(cfg_path) is not first
@@ -4,7 +4,7 @@ from datetime import date
 
 import pandas as pd
 
-from core.dates import fiscal_year, fiscal_year_series, write_sample_fy_check
+from core.dates import fiscal_year, fiscal_year_series, month_start, write_sample_fy_check
 
 
 def test_boundary_sept_30_and_oct_1() -> None:
@@ -18,6 +18,18 @@ def test_vectorized_mapping_consistency() -> None:
     assert fy.tolist() == [2024, 2025, 2025, 2026]
 
 
+def test_month_start_matches_period_round_trip() -> None:
+    dates = pd.to_datetime(
+        ["1999-12-31 23:59", "2024-02-29 00:00", "2025-10-01 00:00", "2025-10-15 12:00", None]
+    )
+    expected = pd.DatetimeIndex(dates).to_period("M").to_timestamp()
+    pd.testing.assert_index_equal(month_start(dates), expected, check_exact=True)
+    assert month_start(pd.Series(dates[:2])).tolist() == [
+        pd.Timestamp("1999-12-01"),
+        pd.Timestamp("2024-02-01"),
+    ]
+
+
 def test_sample_artifact_written(tmp_path) -> None:
     out = write_sample_fy_check(tmp_path / "sample.csv")
     df = pd.read_csv(out)
@@ -5,6 +5,7 @@ import pandas as pd
 from macro.config import MacroConfig
 from macro.gdp import build_gdp_function
 from macro.deficits import build_primary_deficit_series
+from macro.series_utils import fill_year_map
 
 
 def _cfg(frame: str, pct_map: dict[int, float]) -> MacroConfig:
@@ -54,3 +55,21 @@ def test_build_primary_deficit_series_cy_mapping() -> None:
     assert abs(series.sum() - d26_cy) < 1e-6
 
 
+def test_fill_year_map_explicit_and_carried_years() -> None:
+    # All years listed: values passed through as floats
+    assert fill_year_map({2025: 3, 2026: 2.5}, [2026, 2025]) == {2026: 2.5, 2025: 3.0}
+    # Gaps carry the last value forward; years before the first backfill with the earliest
+    assert fill_year_map({2026: 2.0, 2028: 4.0}, [2025, 2027, 2029]) == {
+        2025: 2.0,
+        2027: 2.0,
+        2029: 4.0,
+    }
+    assert fill_year_map({}, [2025]) == {2025: 0.0}
+
+
+def test_fill_year_map_coerces_raw_keys_and_values() -> None:
+    assert fill_year_map({"2026": "2.0", 2028: 4}, [2025, 2027, 2029]) == {
+        2025: 2.0,
+        2027: 2.0,
+        2029: 4.0,
+    }
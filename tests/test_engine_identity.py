@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from macro.rates import build_month_index, ConstantRatesProvider
 from macro.issuance import FixedSharesPolicy
 from engine.state import DebtState
-from engine.project import ProjectionEngine
+from engine.project import ProjectionEngine, _recurrence, _recurrence_jit
+from engine.accrual import compute_interest
+from engine.transitions import compute_redemptions, update_state
 
 
 def test_budget_identity_simple() -> None:
@@ -41,3 +45,63 @@ def test_budget_identity_with_other_interest() -> None:
     assert (abs(lhs - rhs) < 1e-6).all()
 
 
+def test_run_matches_per_step_functions() -> None:
+    idx = build_month_index("2025-07-01", 6)
+    rates = ConstantRatesProvider({"short": 0.03, "nb": 0.04, "tips": 0.02})
+    issuance = FixedSharesPolicy(short=0.3, nb=0.6, tips=0.1)
+    start = DebtState(stock_short=1_000_000.0, stock_nb=500_000.0, stock_tips=200_000.0)
+    deficits = pd.Series([200.0, -50.0, 75.0, 0.0, 310.0, 12.5], index=idx)
+
+    engine = ProjectionEngine(rates_provider=rates, issuance_policy=issuance)
+    df = engine.run(
+        idx, start, deficits, decay_nb=0.02, decay_tips=0.01, coupon_nb_existing_annual=0.035
+    )
+
+    state = start
+    for dt in idx:
+        assert (df.at[dt, "stock_short"], df.at[dt, "stock_nb"], df.at[dt, "stock_tips"]) == (
+            state.stock_short,
+            state.stock_nb,
+            state.stock_tips,
+        )
+        acc = compute_interest(
+            state, {"short": 0.03, "nb": 0.04, "tips": 0.02}, coupon_nb_existing_annual=0.035
+        )
+        reds = compute_redemptions(state, 0.02, 0.01)
+        gfn = deficits[dt] + acc["interest_total"] + 0.0 + sum(reds)
+        assert df.at[dt, "interest_total"] == acc["interest_total"]
+        assert df.at[dt, "gfn"] == gfn
+        state = update_state(state, 0.3 * gfn, 0.6 * gfn, 0.1 * gfn, 0.02, 0.01)
+
+
+def test_repeated_runs_return_independent_traces() -> None:
+    idx = build_month_index("2025-07-01", 4)
+    rates = ConstantRatesProvider({"short": 0.03, "nb": 0.04, "tips": 0.02})
+    issuance = FixedSharesPolicy(short=0.3, nb=0.6, tips=0.1)
+    start = DebtState(stock_short=1_000_000.0, stock_nb=500_000.0, stock_tips=200_000.0)
+    deficits = pd.Series(100.0, index=idx)
+    engine = ProjectionEngine(rates_provider=rates, issuance_policy=issuance)
+
+    first = engine.run(idx, start, deficits)
+    first.loc[idx[0], "shares_short"] = 0.0  # trace is writable and owns its data
+    second = engine.run(idx, start, deficits)
+
+    assert second["shares_short"].tolist() == [0.3] * 4
+    pd.testing.assert_frame_equal(second, engine.run(idx, start, deficits))
+
+
+@pytest.mark.skipif(_recurrence_jit is None, reason="numba not installed")
+def test_recurrence_jit_matches_python_exactly() -> None:
+    rng = np.random.default_rng(7)
+    n = 240
+    rates = [rng.uniform(0.0, 0.005, n) for _ in range(3)]
+    shares = [rng.uniform(0.0, 1.0, n) for _ in range(3)]
+    deficits = rng.normal(150.0, 400.0, n)
+    other = rng.uniform(0.0, 50.0, n)
+    scalars = (1_000_000.0, 500_000.0, 200_000.0, 0.013, 0.007)
+
+    jit = _recurrence_jit(*rates, *shares, deficits, other, *scalars)
+    ref = _recurrence(*(a.tolist() for a in (*rates, *shares, deficits, other)), *scalars)
+
+    for got, want in zip(jit, ref):
+        np.testing.assert_array_equal(got, want)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from macro.gdp import GDPModel, build_gdp_function, write_gdp_check_csv
 
@@ -34,3 +36,34 @@ def test_artifact_written(tmp_path: Path) -> None:
     df = pd.read_csv(out)
     assert df.shape[0] == 3
     assert {"year", "gdp_fy", "gdp_cy"}.issubset(df.columns)
+
+
+def test_array_matches_scalar_and_nans_missing_growth() -> None:
+    model = build_gdp_function(
+        "2025-07-01", 100.0, {2024: 0.02, 2025: 0.08, 2026: 0.10, 2027: 0.05}
+    )
+    years = [2022, 2023, 2024, 2025, 2026, 2027, 2028]
+    fy = model.gdp_fy_array(years)
+    cy = model.gdp_cy_array(years)
+    for i, y in enumerate(years):
+        try:
+            assert fy[i] == model.gdp_fy(y)
+        except KeyError:
+            assert np.isnan(fy[i])
+        try:
+            assert cy[i] == model.gdp_cy(y)
+        except KeyError:
+            assert np.isnan(cy[i])
+    # FY2022 needs FY2023 growth (missing); FY2028 needs FY2028 growth (missing)
+    assert np.isnan(fy[0]) and np.isnan(fy[-1]) and np.isnan(cy[-2])
+
+
+def test_gdp_fy_memoized_per_instance() -> None:
+    model = build_gdp_function("2025-07-01", 100.0, {2026: 0.10, 2027: 0.05})
+    first = model.gdp_fy(2027)
+    assert model.gdp_fy(2027) == first == 100.0 * 1.10 * 1.05
+    # Model stays comparable/frozen; failures are not cached
+    assert model == build_gdp_function("2025-07-01", 100.0, {2026: 0.10, 2027: 0.05})
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            model.gdp_fy(2028)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.io_utils import HAS_PARQUET, trace_read_path, write_preview, write_trace
+from diagnostics.qa import _read_monthly_trace
+
+
+def test_write_trace_round_trips_through_reader(tmp_path) -> None:
+    idx = pd.DatetimeIndex(pd.date_range("2025-01-01", periods=4, freq="MS"), name="date")
+    df = pd.DataFrame({"interest_total": np.arange(4.0), "other_interest": 0.5}, index=idx)
+
+    written = write_trace(df, tmp_path / "monthly_trace.parquet")
+
+    assert written.suffix == (".parquet" if HAS_PARQUET else ".csv")
+    expected = written.with_suffix(".feather") if HAS_PARQUET else written
+    assert trace_read_path(tmp_path / "monthly_trace.parquet") == expected
+    back = _read_monthly_trace(tmp_path / "monthly_trace.parquet")
+    pd.testing.assert_frame_equal(back, df, check_freq=False)
+
+
+def test_trace_read_path_missing(tmp_path) -> None:
+    with pytest.raises(FileNotFoundError):
+        trace_read_path(tmp_path / "monthly_trace.parquet")
+
+
+@pytest.mark.skipif(not HAS_PARQUET, reason="Feather sidecar needs PyArrow")
+def test_trace_read_path_skips_stale_feather_sidecar(tmp_path) -> None:
+    idx = pd.DatetimeIndex(pd.date_range("2025-01-01", periods=3, freq="MS"), name="date")
+    df = pd.DataFrame({"interest_total": np.arange(3.0)}, index=idx)
+    written = write_trace(df, tmp_path / "monthly_trace.parquet")
+    sidecar = written.with_suffix(".feather")
+
+    st = sidecar.stat()
+    os.utime(written, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert trace_read_path(written) == written
+    back = _read_monthly_trace(written, columns=("interest_total",))
+    pd.testing.assert_frame_equal(back, df, check_freq=False)
+
+
+def test_write_preview_formats(tmp_path) -> None:
+    df = pd.DataFrame(
+        {"date": pd.date_range("2025-01-01", periods=3, freq="MS"), "value": [1.0, 2.0, 3.0]}
+    )
+
+    csv = write_preview(df, tmp_path / "preview.csv")
+    assert csv.read_text().splitlines()[:2] == ["date,value", "2025-01-01,1.0"]
+
+    written = write_preview(df, tmp_path / "preview.csv", fmt="parquet")
+    assert written.suffix == (".parquet" if HAS_PARQUET else ".csv")
+    with pytest.raises(ValueError):
+        write_preview(df, tmp_path / "preview.csv", fmt="xlsx")
@@ -4,6 +4,7 @@ from pathlib import Path
 import json
 
 import pandas as pd
+import pytest
 
 from diagnostics.qa import _compose_hist_vs_forward_series, run_qa
 from macro.config import load_macro_yaml
@@ -35,9 +36,8 @@ def test_compose_hist_vs_forward_series_anchor_splice() -> None:
     assert fwd_s.loc[2026] == fy_2026_remainder
 
 
-def test_run_qa_writes_hist_vs_forward(tmp_path: Path) -> None:
-    # Prepare minimal files expected by run_qa
-    base = tmp_path
+def _write_qa_inputs(base: Path) -> Path:
+    """Prepare minimal files expected by run_qa under ``base``; returns the macro YAML path."""
     (base / "diagnostics").mkdir(parents=True, exist_ok=True)
     # Minimal monthly trace CSV
     m = pd.DataFrame({
@@ -80,13 +80,19 @@ issuance_default_shares:
   nb: 0.7
   tips: 0.1
 """
-    (tmp_path / "macro.yaml").write_text(cfg_text)
+    (base / "macro.yaml").write_text(cfg_text)
+    return base / "macro.yaml"
+
+
+def test_run_qa_writes_hist_vs_forward(tmp_path: Path) -> None:
+    base = tmp_path
+    macro = _write_qa_inputs(base)
 
     run_qa(
         monthly_trace_path=base / "diagnostics" / "monthly_trace.csv",
         annual_cy_path=base / "calendar_year" / "spreadsheets" / "annual.csv",
         annual_fy_path=base / "fiscal_year" / "spreadsheets" / "annual.csv",
-        macro_path=tmp_path / "macro.yaml",
+        macro_path=macro,
         out_base=base,
     )
     # New files should exist in FY and CY visualization folders
@@ -102,3 +108,100 @@ issuance_default_shares:
     assert any(lbl.endswith("%") for lbl in meta["left_ticklabels"])  # formatting present
 
 
+def test_gdp_growth_fill_carries_last_provided_rate(tmp_path: Path) -> None:
+    from diagnostics.qa import _gdp_model
+
+    yml = tmp_path / "macro.yaml"
+    yml.write_text(
+        """
+anchor_date: 2025-07-15
+horizon_months: 12
+gdp:
+  anchor_fy: 2025
+  anchor_value_usd_millions: 28000000
+  annual_fy_growth_rate:
+    2024: 5.0
+    2028: 3.0
+deficits:
+  frame: FY
+"""
+    )
+    model = _gdp_model(yml, 2026, 2029)
+    # 2026-2027 carry FY2024's rate forward (not back-filled from FY2028)
+    assert model.growth_fy == {2026: 0.05, 2027: 0.05, 2028: 0.03, 2029: 0.03, 2030: 0.03}
+
+
+def test_read_monthly_trace_projects_columns(tmp_path: Path) -> None:
+    from diagnostics.qa import QA_TRACE_COLUMNS, _read_monthly_trace
+
+    idx = pd.date_range("2025-01-01", periods=3, freq="MS", name="date")
+    cols = ["interest_total", "stock_short", "stock_nb", "stock_tips", "unused_col"]
+    pd.DataFrame({c: [1.0, 2.0, 3.0] for c in cols}, index=idx).to_csv(
+        tmp_path / "monthly_trace.csv"
+    )
+    df = _read_monthly_trace(tmp_path / "monthly_trace.csv", columns=QA_TRACE_COLUMNS)
+    assert list(df.columns) == cols[:-1]
+    assert df.index.name == "date" and df.index[0] == pd.Timestamp("2025-01-01")
+
+
+def test_render_all_skips_unchanged_charts(tmp_path: Path) -> None:
+    from diagnostics.qa import _read_monthly_trace, render_all
+
+    macro = _write_qa_inputs(tmp_path)
+    monthly = _read_monthly_trace(tmp_path / "diagnostics" / "monthly_trace.csv")
+    kwargs = dict(
+        annual_cy_path=tmp_path / "calendar_year" / "spreadsheets" / "annual.csv",
+        annual_fy_path=tmp_path / "fiscal_year" / "spreadsheets" / "annual.csv",
+        macro_path=macro,
+        base=tmp_path,
+        reuse=True,
+    )
+    first = render_all(monthly, **kwargs)
+    stamps = {name: p.stat().st_mtime_ns for name, p in first.items()}
+    # Same inputs: every chart comes back from its fingerprint stamp without re-rendering
+    second = render_all(monthly, **kwargs)
+    assert second == first
+    assert {name: p.stat().st_mtime_ns for name, p in second.items()} == stamps
+    # Changed trace values: charts are rendered again
+    render_all(monthly.assign(interest_total=monthly["interest_total"] * 2), **kwargs)
+    assert first["monthly_interest"].stat().st_mtime_ns != stamps["monthly_interest"]
+    # Reuse is opt-in: the default always re-renders
+    stamps = {name: p.stat().st_mtime_ns for name, p in first.items()}
+    render_all(monthly, **{**kwargs, "reuse": False})
+    assert first["annual_fy"].stat().st_mtime_ns != stamps["annual_fy"]
+
+
+def test_render_all_writes_trace_charts_before_split_errors(tmp_path: Path) -> None:
+    from diagnostics.qa import _read_monthly_trace, render_all
+
+    macro = _write_qa_inputs(tmp_path)
+    monthly = _read_monthly_trace(tmp_path / "diagnostics" / "monthly_trace.csv")
+    (tmp_path / "diagnostics" / "interest_fy_totals.csv").unlink()
+    with pytest.raises(FileNotFoundError):
+        render_all(
+            monthly,
+            annual_cy_path=tmp_path / "calendar_year" / "spreadsheets" / "annual.csv",
+            annual_fy_path=tmp_path / "fiscal_year" / "spreadsheets" / "annual.csv",
+            macro_path=macro,
+            base=tmp_path,
+        )
+    assert (tmp_path / "calendar_year" / "visualizations" / "monthly_interest.png").exists()
+    assert (tmp_path / "fiscal_year" / "visualizations" / "effective_rate.png").exists()
+
+
+def test_read_hist_monthly_returns_independent_frames(tmp_path: Path) -> None:
+    from diagnostics.qa import _read_hist_monthly
+
+    src = tmp_path / "interest_monthly.csv"
+    pd.DataFrame(
+        {
+            "Record Date": ["2025-02-28", "2025-01-31"],
+            "Debt Category": ["Bills", "Notes & Bonds"],
+            "Interest Expense": [1.0, 2.0],
+        }
+    ).to_csv(src, index=False)
+    first = _read_hist_monthly(src)
+    first.loc[:, "Interest Expense"] = 0.0
+    second = _read_hist_monthly(src)
+    assert second["Interest Expense"].tolist() == [2.0, 1.0]
+    assert list(second["Record Date"]) == [pd.Timestamp("2025-01-01"), pd.Timestamp("2025-02-01")]
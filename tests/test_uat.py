@@ -151,3 +151,25 @@ def test_run_uat_minimal(tmp_path: Path, monkeypatch):
     assert checks.get("cli_outputs_present") is True
 
 
+def test_run_uat_reports_missing_trace_fields(tmp_path: Path):
+    macro = _write_minimal_macro(tmp_path)
+    out_dir = tmp_path / "output"
+    monthly = _write_minimal_monthly(out_dir / "diagnostics")
+    pd.read_csv(monthly).drop(columns=["gfn"]).to_csv(monthly, index=False)
+    cy = _write_annual(out_dir, "CY")
+    fy = _write_annual(out_dir, "FY")
+
+    checklist_path = run_uat(
+        config_path=macro,
+        monthly_trace_path=monthly,
+        annual_cy_path=cy,
+        annual_fy_path=fy,
+        bridge_table_path=tmp_path / "missing_bridge.csv",
+        calibration_matrix_path=tmp_path / "missing_calibration.csv",
+        parameters_path=tmp_path / "missing_parameters.json",
+        out_path=out_dir / "diagnostics" / "uat_checklist.json",
+    )
+
+    payload = json.loads(checklist_path.read_text(encoding="utf-8"))
+    assert payload["checks"]["monthly_trace_fields_present"] is False
+    assert payload["notes"]["monthly_trace_missing_fields"] == ["gfn"]